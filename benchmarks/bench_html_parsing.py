@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: lxml vs html.parser for Bing results and the faculty roster page
+
+Parses the saved HTML fixtures with both parser backends, checks that they
+extract the same data and reports the mean time per page.
+
+Usage:
+    python benchmarks/bench_html_parsing.py [--iterations 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, 'benchmarks', 'fixtures')
+sys.path.insert(0, ROOT)
+
+from enhanced_faculty_media_tracker import EnhancedFacultyMediaTracker
+
+
+def time_parser(func, content: bytes, iterations: int) -> float:
+    """Mean seconds per call"""
+    func(content)  # Warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(content)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML parser backend micro-benchmark')
+    parser.add_argument('--iterations', type=int, default=50, help='Parses per fixture and backend')
+    args = parser.parse_args()
+
+    tracker = EnhancedFacultyMediaTracker(os.path.join(FIXTURES, 'missing-config.yaml'))
+    cases = [
+        ('Bing SERP', 'bing_serp.html', tracker.parse_bing_results),
+        ('Faculty roster', 'faculty_affiliates.html', tracker.parse_faculty_page),
+    ]
+
+    print(f"{'Fixture':<16} {'html.parser':>12} {'lxml':>12} {'speedup':>9}")
+    for label, filename, func in cases:
+        with open(os.path.join(FIXTURES, filename), 'rb') as f:
+            content = f.read()
+
+        timings, outputs = {}, {}
+        for backend in ('html.parser', 'lxml'):
+            tracker.config['search']['html_parser'] = backend
+            outputs[backend] = func(content)
+            timings[backend] = time_parser(func, content, args.iterations)
+
+        if outputs['html.parser'] != outputs['lxml']:
+            print(f"⚠️  {label}: backends extracted different results")
+        print(f"{label:<16} {timings['html.parser'] * 1000:>10.2f}ms {timings['lxml'] * 1000:>10.2f}ms "
+              f"{timings['html.parser'] / timings['lxml']:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
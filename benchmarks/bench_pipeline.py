@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark for EnhancedFacultyMediaTracker.run_search
+
+Replays recorded fixtures instead of hitting the network: the faculty
+affiliates page, a Google Custom Search JSON response and a Bing results
+page. The fixtures were recorded for "Adil Haque"; the stub session rewrites
+that name to whichever faculty member is being queried, so every search
+returns a realistic mix of relevant and irrelevant hits.
+
+Reports per-stage timings (roster, search, filter, date extract, result
+store, Excel, Word) and search throughput in faculty/sec.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--faculty 40] [--workers 4] [--parse-workers 4] [--latency-ms 0] [--json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, 'benchmarks', 'fixtures')
+sys.path.insert(0, ROOT)
+
+from enhanced_faculty_media_tracker import DateExtractor, EnhancedFacultyMediaTracker, RequestsTransport
+
+RECORDED_NAME = 'Adil Haque'
+
+
+class FixtureSession:
+    """Stand-in for requests.Session that serves recorded responses"""
+
+    def __init__(self, latency: float = 0.0):
+        self.headers = {}
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.fixtures = {}
+        for name in ('faculty_affiliates.html', 'google_cse.json', 'bing_serp.html'):
+            with open(os.path.join(FIXTURES, name), 'rb') as f:
+                self.fixtures[name] = f.read().decode('utf-8')
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        host = urllib.parse.urlparse(url).hostname or ''
+        if host == 'csrr.rutgers.edu':
+            return self.response(url, self.fixtures['faculty_affiliates.html'], 'text/html')
+
+        if host == 'www.googleapis.com':
+            if int(params.get('start', 1)) > 1:
+                # Only the first page was recorded; deeper pages come back empty
+                return self.response(url, '{"kind": "customsearch#search", "queries": {}}', 'application/json')
+            query, fixture, content_type = params['q'], 'google_cse.json', 'application/json'
+        elif host == 'www.bing.com':
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)['q'][0]
+            fixture, content_type = 'bing_serp.html', 'text/html'
+        else:
+            return self.response(url, '', 'text/plain', status=404)
+
+        match = re.search(r'"([^"]+)"', query)
+        faculty_name = match.group(1) if match else RECORDED_NAME
+        body = self.fixtures[fixture].replace(RECORDED_NAME, faculty_name)
+        body = body.replace(RECORDED_NAME.lower().replace(' ', '-'), faculty_name.lower().replace(' ', '-'))
+        return self.response(url, body, content_type)
+
+    @staticmethod
+    def response(url: str, body: str, content_type: str, status: int = 200) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response._content = body.encode('utf-8')
+        response.headers = CaseInsensitiveDict({'Content-Type': f'{content_type}; charset=utf-8'})
+        response.encoding = 'utf-8'
+        return response
+
+
+class StageTimer:
+    """Accumulates wall time per stage by wrapping tracker methods"""
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, elapsed: float):
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + elapsed
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def wrap(self, obj, method: str, stage: str):
+        original = getattr(obj, method)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        setattr(obj, method, timed)
+
+    def wrap_generator(self, obj, method: str, stage: str):
+        """Time a generator from first next() until exhaustion"""
+        original = getattr(obj, method)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                yield from original(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        setattr(obj, method, timed)
+
+
+def build_tracker(workdir: str, faculty_limit: int, workers: int, latency: float,
+                  parse_workers: int = 0) -> EnhancedFacultyMediaTracker:
+    tracker = EnhancedFacultyMediaTracker(os.path.join(workdir, 'config.yaml'))
+    tracker.session = FixtureSession(latency)
+    tracker.transport = RequestsTransport(tracker.session)
+    tracker.google_api_key = tracker.google_cse_id = 'benchmark'
+    tracker.cache = None
+
+    config = tracker.config
+    config['search'].update({
+        'use_google_api': True, 'use_basic_search': True, 'max_workers': workers, 'parse_workers': parse_workers
+    })
+    config['search_period'].update({'start_date': '2025-06-01', 'end_date': '2025-08-19'})
+    config['output'].update({
+        'excel_filename': os.path.join(workdir, 'report.xlsx'),
+        'save_to_downloads': False
+    })
+    config['faculty'].update({'auto_fetch_from_website': True, 'roster_cache': None})
+    config['checkpoint']['path'] = os.path.join(workdir, 'checkpoint.jsonl')
+    config['store']['path'] = os.path.join(workdir, 'results.sqlite')
+    tracker.store = tracker.create_store()
+    for limiter in tracker.rate_limiters.values():
+        limiter.qps = 0
+
+    if faculty_limit:
+        # Trim the scraped roster so small runs stay quick
+        load_roster = tracker.load_faculty_roster
+        tracker.load_faculty_roster = lambda: load_roster()[:faculty_limit]
+    return tracker
+
+
+def run_benchmark(faculty_limit: int, workers: int, latency: float, parse_workers: int = 0) -> dict:
+    timer = StageTimer()
+    with tempfile.TemporaryDirectory() as workdir:
+        tracker = build_tracker(workdir, faculty_limit, workers, latency, parse_workers)
+        timer.wrap(tracker, 'load_faculty_roster', 'roster')
+        timer.wrap_generator(tracker, 'iter_faculty_searches', 'search')
+        timer.wrap(tracker, 'validate_faculty_mention', 'filter')
+        timer.wrap(tracker, 'is_relevant_source', 'filter')
+        # run_search builds a fresh extractor for the searched period, so time the class method
+        extract_many = DateExtractor.extract_many
+        timer.wrap(DateExtractor, 'extract_many', 'date_extract')
+        timer.wrap(tracker.store, 'add', 'store')
+        timer.wrap(tracker, 'create_excel_report', 'excel')
+        timer.wrap(tracker, 'create_word_report', 'word')
+
+        cwd = os.getcwd()
+        os.chdir(workdir)  # The Word report is written to the working directory
+        try:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = tracker.run_search()
+            total = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+            DateExtractor.extract_many = extract_many
+
+        faculty_count = len(tracker.fetch_faculty_list())
+        search_seconds = timer.seconds.get('search', 0.0)
+        return {
+            'faculty': faculty_count,
+            'workers': workers,
+            'parse_workers': parse_workers,
+            'requests': tracker.session.requests,
+            'articles': summary['total_articles'],
+            'total_seconds': total,
+            'stages': {stage: round(seconds, 4) for stage, seconds in timer.seconds.items()},
+            'faculty_per_second': faculty_count / search_seconds if search_seconds else 0.0,
+            'filter_rejected': {
+                name: tracker.metrics.counter_total('filter_rejected', filter=name)
+                for name in ('faculty_mention', 'relevant_source', 'date')
+            }
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline run_search benchmark using recorded fixtures')
+    parser.add_argument('--faculty', type=int, default=40, help='Faculty to search (0 = whole roster)')
+    parser.add_argument('--workers', type=int, default=1, help='search.max_workers')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='search.parse_workers (parse + filter in worker processes; filter/date_extract then read 0)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated network latency per request')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON (for CI)')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.faculty, args.workers, args.latency_ms / 1000.0, args.parse_workers)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"Faculty: {result['faculty']}  workers: {result['workers']}  parse workers: {result['parse_workers']}  "
+          f"requests: {result['requests']}  articles: {result['articles']}")
+    for stage in ('roster', 'search', 'filter', 'date_extract', 'store', 'excel', 'word'):
+        print(f"  {stage:<13} {result['stages'].get(stage, 0.0) * 1000:>10.1f} ms")
+    print(f"  {'total':<13} {result['total_seconds'] * 1000:>10.1f} ms")
+    print("Filter drops: " + ", ".join(f"{name} {count:.0f}" for name, count in result['filter_rejected'].items()))
+    print(f"Throughput: {result['faculty_per_second']:.1f} faculty/sec")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+CLI cold-start benchmark for enhanced_faculty_media_tracker
+
+Measures, in fresh interpreters:
+  - module import time and the heaviest imports it pulls in (python -X importtime)
+  - wall time of the quick CLI paths (--setup-api, --create-config)
+  - a bare interpreter start-up, for reference
+
+`python enhanced_faculty_media_tracker.py` compiles the script on every run;
+`python -m enhanced_faculty_media_tracker` reuses the cached bytecode, which is
+what the launchers and cron jobs should use. Both are reported.
+
+Heavy packages (requests, bs4, lxml, openpyxl, docx, yaml, httpx) should not
+show up in the import profile; they are imported by the code that needs them.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--top 10] [--json]
+"""
+
+import argparse
+import json
+import os
+import py_compile
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'enhanced_faculty_media_tracker.py')
+MODULE = 'enhanced_faculty_media_tracker'
+
+
+def parse_importtime(stderr: str):
+    """[(depth, self_us, cumulative_us, name)] from -X importtime output, in print order"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return entries
+
+
+def import_profile(top: int) -> dict:
+    """Import time of the module and its heaviest direct imports"""
+    # Compile up front (even under PYTHONDONTWRITEBYTECODE) so compilation is not counted
+    py_compile.compile(SCRIPT)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {MODULE}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    entries = parse_importtime(result.stderr)
+    index = next(i for i, entry in enumerate(entries) if entry[3] == MODULE and entry[0] == 0)
+
+    # Children are printed before their parent, back to the previous top-level entry
+    start = index
+    while start > 0 and entries[start - 1][0] > 0:
+        start -= 1
+    children = [entry for entry in entries[start:index] if entry[0] == 1]
+    children.sort(key=lambda entry: entry[2], reverse=True)
+    return {
+        'module_ms': entries[index][2] / 1000.0,
+        'heaviest': [{'name': name, 'ms': cumulative / 1000.0} for _, _, cumulative, name in children[:top]]
+    }
+
+
+def wall_time(args, runs: int, cwd: str) -> float:
+    """Median wall time in ms of running the command in a fresh interpreter"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def run_benchmark(runs: int, top: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        config_path = os.path.join(workdir, 'config.yaml')
+        create_config_ms = []
+        for _ in range(runs):
+            if os.path.exists(config_path):
+                os.remove(config_path)
+            create_config_ms.append(wall_time([sys.executable, SCRIPT, '--create-config', '--config', config_path], 1, workdir))
+
+        return {
+            'import': import_profile(top),
+            'cli_ms': {
+                'python -c pass': wall_time([sys.executable, '-c', 'pass'], runs, workdir),
+                '--setup-api': wall_time([sys.executable, SCRIPT, '--setup-api'], runs, workdir),
+                '-m ... --setup-api': wall_time([sys.executable, '-m', MODULE, '--setup-api'], runs, ROOT),
+                '--create-config': statistics.median(create_config_ms)
+            }
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI start-up benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (median is reported)')
+    parser.add_argument('--top', type=int, default=10, help='Heaviest imports to list')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON (for CI)')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.runs, args.top)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"import {MODULE}: {result['import']['module_ms']:.1f} ms")
+    for entry in result['import']['heaviest']:
+        print(f"  {entry['name']:<24} {entry['ms']:>8.1f} ms")
+    print("CLI wall time (median):")
+    for command, ms in result['cli_ms'].items():
+        print(f"  {command:<24} {ms:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
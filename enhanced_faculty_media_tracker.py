@@ -7,69 +7,1845 @@ Author: AI Assistant
 Date: 2025
 """
 
-import pandas as pd
-from docx import Document
+# Heavy third-party packages (requests, bs4, lxml, httpx, openpyxl, docx, yaml) are imported
+# where they are used, so --setup-api, --create-config and cron start-up stay fast
+import abc
 import time
 import random
-from datetime import datetime, timedelta
-import requests
-from bs4 import BeautifulSoup
+from datetime import datetime, timedelta, date
+import importlib
 import urllib.parse
 import re
 import json
+import csv
 import os
-from typing import List, Dict, Optional
+import sys
+import hashlib
+import sqlite3
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Optional, Iterator, Iterable, Tuple, NamedTuple, Callable
 import argparse
-import yaml
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
+
+def optional_import(module: str):
+    """Import an optional dependency on first use; None if it is not installed"""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        return None
+
+
+class BudgetExhausted(Exception):
+    """A search request was refused by the run's request budget or a backend's daily quota"""
+
+
+class DeadlineExceeded(BudgetExhausted):
+    """A search request would have to wait on the rate limiter past the backend's latency budget"""
+
+
+class PartialResults(Exception):
+    """A query failed part way through; `results` holds what it found first (the error is __cause__)"""
+
+    def __init__(self, results: List['MediaHit']):
+        super().__init__(f"{len(results)} results before the error")
+        self.results = results
+
+
+class RequestBudget:
+    """Thread-safe cap on the number of outbound search requests in one run"""
+
+    def __init__(self, max_requests: int = 0):
+        self.max_requests = max_requests  # 0 means unlimited
+        self.used = 0
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Reserve one request; returns False once the budget is spent"""
+        with self._lock:
+            if self.max_requests and self.used >= self.max_requests:
+                if not self.exhausted:
+                    self.exhausted = True
+                    print(f"  ⚠️  Request budget of {self.max_requests} exhausted, skipping remaining queries")
+                return False
+            self.used += 1
+            return True
+
+
+class QuotaLedger:
+    """Requests sent per backend account and calendar day, kept in SQLite
+
+    Lets the daily quota hold across runs (cron re-runs, --resume) and across
+    processes that share an API key on the same host.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Autocommit mode, so consume() can take the write lock itself with BEGIN IMMEDIATE
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota_usage ("
+                " account TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL, PRIMARY KEY (account, day))"
+            )
+        return self._conn
+
+    def consume(self, account: str, day: date, quota: int) -> bool:
+        """Count one request against the day's quota; False (nothing counted) once it is used up"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT used FROM quota_usage WHERE account = ? AND day = ?", (account, day.isoformat())
+                ).fetchone()
+                if quota and row is not None and row[0] >= quota:
+                    return False
+                conn.execute(
+                    "INSERT INTO quota_usage (account, day, used) VALUES (?, ?, 1)"
+                    " ON CONFLICT(account, day) DO UPDATE SET used = used + 1",
+                    (account, day.isoformat())
+                )
+                return True
+            finally:
+                conn.execute("COMMIT")
+
+    def used(self, account: str, day: date) -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT used FROM quota_usage WHERE account = ? AND day = ?", (account, day.isoformat())
+            ).fetchone()
+        return row[0] if row else 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RateLimiter:
+    """Token bucket that holds one search backend to a fixed QPS and daily quota
+
+    With a QuotaLedger the daily count is shared with earlier runs and other processes;
+    without one it only covers this process.
+    """
+
+    def __init__(self, name: str, qps: float = 0, burst: int = 1, daily_quota: int = 0,
+                 ledger: Optional[QuotaLedger] = None, account: str = ''):
+        self.name = name
+        self.ledger = ledger
+        self.account = account  # Quota is per API key, so shards with their own keys count separately
+        self.qps = float(qps or 0)  # 0 means no rate limit
+        self.burst = max(1, int(burst or 1))
+        self.daily_quota = int(daily_quota or 0)  # 0 means unlimited
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._day = date.today()
+        self._used_today = 0
+        self._quota_warned = False
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Block until a request may be sent; returns False once the daily quota is spent
+
+        Raises DeadlineExceeded instead of waiting past `deadline` (a time.monotonic() value).
+        """
+        while True:
+            with self._lock:
+                today = date.today()
+                if today != self._day:
+                    self._day, self._used_today, self._quota_warned = today, 0, False
+                
+                if self.daily_quota and self._used_today >= self.daily_quota:
+                    return self.quota_reached()
+                
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif not self.qps:
+                    return self.count_request(today)
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return self.count_request(today)
+                    wait = (1 - self._tokens) / self.qps
+                if deadline is not None and now + wait > deadline:
+                    raise DeadlineExceeded(self.name)
+            time.sleep(wait)
+
+    def count_request(self, today: date) -> bool:
+        """Charge one request to today's quota (called with the lock held)"""
+        if self.ledger is not None and self.daily_quota:
+            if not self.ledger.consume(f"{self.name}:{self.account}", today, self.daily_quota):
+                self._used_today = self.daily_quota  # Spent by earlier runs or another process
+                return self.quota_reached()
+        self._used_today += 1
+        return True
+
+    def quota_reached(self) -> bool:
+        if not self._quota_warned:
+            self._quota_warned = True
+            print(f"  ⚠️  {self.name} daily quota of {self.daily_quota} requests reached")
+        return False
+
+    def pause(self, seconds: float):
+        """Hold back every caller of this backend, e.g. after a 429 with Retry-After"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class QueryCache:
+    """SQLite-backed cache of raw search responses with TTL and LRU eviction"""
+
+    def __init__(self, path: str, ttl_hours: float = 72, max_entries: int = 50000, refresh: bool = False):
+        self.path = path
+        self.ttl_seconds = float(ttl_hours) * 3600
+        self.max_entries = int(max_entries or 0)  # 0 means unbounded
+        self.refresh = refresh  # Skip reads but still store fresh responses
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, backend TEXT NOT NULL, query TEXT NOT NULL,"
+                " content BLOB NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(backend: str, query: str, start_date: str, end_date: str, extra: str = "") -> str:
+        """Key on backend + normalized query + date window (+ e.g. page number)"""
+        normalized = " ".join(query.lower().split())
+        raw = json.dumps([backend, normalized, start_date, end_date, extra])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached content, or None if missing, expired or refreshing"""
+        if self.refresh:
+            self.misses += 1
+            return None
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT content, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row is None or row[1] < now - self.ttl_seconds:
+                if row is not None:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, backend: str, query: str, content: bytes):
+        """Store a response, evicting least recently used entries past max_entries"""
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, backend, query, content, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, backend, query, sqlite3.Binary(content), now, now)
+            )
+            if self.max_entries:
+                count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if count > self.max_entries:
+                    # Evict an extra 10% so we are not deleting on every insert
+                    excess = count - self.max_entries + self.max_entries // 10
+                    conn.execute(
+                        "DELETE FROM responses WHERE key IN"
+                        " (SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                        (excess,)
+                    )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of faculty searches completed in the current period"""
+
+    VERSION = 2  # Entries from older versions are ignored (results were plain dicts)
+
+    def __init__(self, path: str, start_date: str, end_date: str):
+        self.path = path
+        self.period = [start_date, end_date]
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, List['MediaHit']]:
+        """Return {faculty_name: results} for entries recorded for this period"""
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from an interrupted write
+                if entry.get('period') == self.period and entry.get('version') == self.VERSION:
+                    completed[entry['faculty_name']] = [MediaHit.from_dict(hit) for hit in entry['results']]
+        return completed
+
+    def record(self, faculty_name: str, results: List['MediaHit']):
+        """Durably append one completed faculty search"""
+        line = json.dumps({
+            'period': self.period,
+            'version': self.VERSION,
+            'faculty_name': faculty_name,
+            'results': [hit.to_dict() for hit in results],
+            'completed_at': datetime.now().isoformat(timespec='seconds')
+        })
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        with self._lock:
+            open(self.path, 'w').close()
+
+
+class ResultStore:
+    """SQLite store of every run's articles, indexed by faculty, canonical URL, date and source
+
+    Reports are queried from here, and earlier runs stay in the store for trends and
+    for spotting articles that were already reported.
+    """
+
+    ARTICLE_COLUMNS = "a.title, a.url, a.snippet, a.source, a.author, a.published, a.search_method"
+
+    def __init__(self, path: Optional[str]):
+        self.path = path or ':memory:'  # No path keeps results for this run only
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                " run_id INTEGER PRIMARY KEY, started_at TEXT NOT NULL, start_date TEXT, end_date TEXT);"
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " canonical_url TEXT PRIMARY KEY, url TEXT NOT NULL, title TEXT, snippet TEXT, source TEXT,"
+                " author TEXT, publication_date TEXT, published TEXT, search_method TEXT,"
+                " first_run INTEGER NOT NULL, last_run INTEGER NOT NULL);"
+                # Run order (seq) is roster order, so reports match the order results were found in
+                "CREATE TABLE IF NOT EXISTS run_articles ("
+                " run_id INTEGER NOT NULL, seq INTEGER NOT NULL, canonical_url TEXT NOT NULL,"
+                " faculty_name TEXT NOT NULL, faculty_names TEXT NOT NULL,"
+                " PRIMARY KEY (run_id, seq), UNIQUE (run_id, canonical_url));"
+                "CREATE TABLE IF NOT EXISTS article_faculty ("
+                " run_id INTEGER NOT NULL, canonical_url TEXT NOT NULL, faculty_name TEXT NOT NULL,"
+                " PRIMARY KEY (run_id, canonical_url, faculty_name));"
+                "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);"
+                "CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);"
+                "CREATE INDEX IF NOT EXISTS idx_article_faculty_name ON article_faculty(faculty_name, canonical_url);"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def start_run(self, start_date: str, end_date: str) -> int:
+        """Register a run covering the period and return its id"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute(
+                    "INSERT INTO runs (started_at, start_date, end_date) VALUES (?, ?, ?)",
+                    (datetime.now().isoformat(timespec='seconds'), start_date, end_date)
+                ).lastrowid
+
+    def add(self, run_id: int, results: Iterable['MediaHit']):
+        """Store a run's new results, or update ones that gained co-authors, in one transaction
+
+        New results are numbered in arrival order, which is the order reports list them in.
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for result in results:
+                    canonical_url = DuplicateIndex.canonicalize(result.url)
+                    published = result.published.isoformat() if result.published else None
+                    conn.execute(
+                        "INSERT INTO articles (canonical_url, url, title, snippet, source, author,"
+                        " publication_date, published, search_method, first_run, last_run)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT(canonical_url) DO UPDATE SET url = excluded.url, title = excluded.title,"
+                        " snippet = excluded.snippet, source = excluded.source,"
+                        " author = COALESCE(NULLIF(excluded.author, ''), articles.author),"
+                        " publication_date = excluded.publication_date,"
+                        " published = COALESCE(excluded.published, articles.published),"
+                        " search_method = excluded.search_method, last_run = excluded.last_run",
+                        (canonical_url, result.url, result.title, result.snippet, result.source,
+                         result.author, result.publication_date, published, result.search_method, run_id, run_id)
+                    )
+                    conn.execute(
+                        "INSERT INTO run_articles (run_id, seq, canonical_url, faculty_name, faculty_names)"
+                        " SELECT ?, COALESCE(MAX(seq) + 1, 0), ?, ?, ? FROM run_articles WHERE run_id = ?"
+                        " ON CONFLICT(run_id, canonical_url) DO UPDATE SET faculty_names = excluded.faculty_names",
+                        (run_id, canonical_url, result.faculty_name, json.dumps(result.faculty_names), run_id)
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO article_faculty (run_id, canonical_url, faculty_name) VALUES (?, ?, ?)",
+                        [(run_id, canonical_url, name) for name in result.faculty_names]
+                    )
+
+    @staticmethod
+    def selection(run_id: int, report_period: Optional[Dict], max_results: int) -> Tuple[str, List]:
+        """CTE selecting a run's articles in the period, at most max_results per faculty (0 = all)"""
+        start = report_period['start_date'] if report_period else None
+        end = report_period['end_date'] if report_period else None
+        sql = (
+            "WITH selected AS (SELECT seq, canonical_url, faculty_names FROM ("
+            " SELECT ra.seq, ra.canonical_url, ra.faculty_names,"
+            " ROW_NUMBER() OVER (PARTITION BY ra.faculty_name ORDER BY ra.seq) AS rank"
+            " FROM run_articles ra JOIN articles a ON a.canonical_url = ra.canonical_url"
+            " WHERE ra.run_id = ? AND (? IS NULL OR a.published BETWEEN ? AND ?))"
+            " WHERE ? = 0 OR rank <= ?) "
+        )
+        return sql, [run_id, start, start, end, max_results, max_results]
+
+    @staticmethod
+    def to_result(row: Tuple) -> 'MediaHit':
+        """MediaHit from (title, url, snippet, source, author, published, search_method, faculty_names)"""
+        faculty_names = json.loads(row[7])
+        return MediaHit(
+            faculty_names[0], row[0], row[1], row[2], row[3],
+            date.fromisoformat(row[5]) if row[5] else None,
+            row[6], row[4] or '', faculty_names
+        )
+
+    def run_results(self, run_id: int, report_period: Optional[Dict] = None,
+                    max_results: int = 0) -> Iterator['MediaHit']:
+        """A run's results in report order, optionally limited to a period"""
+        sql, params = self.selection(run_id, report_period, max_results)
+        with self._lock:
+            cursor = self._connect().execute(
+                sql + f"SELECT {self.ARTICLE_COLUMNS}, s.faculty_names FROM selected s"
+                " JOIN articles a ON a.canonical_url = s.canonical_url ORDER BY s.seq",
+                params
+            )
+        while True:
+            # Fetched in batches so report writers can stream any number of rows
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            for row in rows:
+                yield self.to_result(row)
+
+    def faculty_results(self, run_id: int, report_period: Optional[Dict] = None,
+                        max_results: int = 0) -> Dict[str, List['MediaHit']]:
+        """{faculty_name: results} sorted by name; co-authored articles appear under each author"""
+        sql, params = self.selection(run_id, report_period, max_results)
+        with self._lock:
+            rows = self._connect().execute(
+                sql + f"SELECT af.faculty_name, {self.ARTICLE_COLUMNS}, s.faculty_names FROM selected s"
+                " JOIN articles a ON a.canonical_url = s.canonical_url"
+                " JOIN article_faculty af ON af.run_id = ? AND af.canonical_url = s.canonical_url"
+                " ORDER BY af.faculty_name, s.seq",
+                params + [run_id]
+            ).fetchall()
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row[0], []).append(self.to_result(row[1:]))
+        return grouped
+
+    def count(self, run_id: int, report_period: Optional[Dict] = None, max_results: int = 0) -> int:
+        """Number of results run_results would return"""
+        sql, params = self.selection(run_id, report_period, max_results)
+        with self._lock:
+            return self._connect().execute(sql + "SELECT COUNT(*) FROM selected", params).fetchone()[0]
+
+    def previously_found(self, run_id: int) -> int:
+        """Articles in this run that an earlier run had already stored"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM run_articles ra JOIN articles a ON a.canonical_url = ra.canonical_url"
+                " WHERE ra.run_id = ? AND a.first_run < ?",
+                (run_id, run_id)
+            ).fetchone()[0]
+
+    def trend(self, faculty_name: Optional[str] = None) -> List[Tuple[str, int, int]]:
+        """(month, articles, faculty) over every stored run, by publication month"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT substr(a.published, 1, 7) AS month, COUNT(DISTINCT a.canonical_url),"
+                " COUNT(DISTINCT af.faculty_name)"
+                " FROM articles a JOIN article_faculty af ON af.canonical_url = a.canonical_url"
+                " WHERE a.published IS NOT NULL AND (? IS NULL OR af.faculty_name = ?)"
+                " GROUP BY month ORDER BY month",
+                (faculty_name, faculty_name)
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SourceFilter:
+    """Compiled source allowlist and keyword matchers used by is_relevant_source"""
+
+    # STRICT: Must be from legitimate news/media sources (matched on hostname suffix)
+    DEFAULT_LEGITIMATE_DOMAINS = [
+        'nytimes.com', 'washingtonpost.com', 'wsj.com', 'usatoday.com', 'latimes.com',
+        'chicagotribune.com', 'bostonglobe.com', 'philly.com', 'miamiherald.com',
+        'cnn.com', 'msnbc.com', 'foxnews.com', 'abcnews.go.com', 'cbsnews.com', 'nbcnews.com',
+        'pbs.org', 'npr.org', 'bbc.com', 'reuters.com', 'ap.org', 'bloomberg.com',
+        'politico.com', 'thehill.com', 'rollcall.com', 'nationalreview.com', 'newyorker.com',
+        'theatlantic.com', 'huffpost.com', 'vox.com', 'slate.com', 'salon.com',
+        'theguardian.com', 'independent.co.uk', 'telegraph.co.uk', 'ft.com', 'economist.com',
+        'aljazeera.com', 'middleeasteye.net', 'newarab.com', 'arabnews.com',
+        'law.com', 'abajournal.com', 'law360.com', 'scotusblog.com', 'justsecurity.org',
+        'lawfaremedia.org', 'balkinization.net', 'volokh.com', 'concurringopinions.com'
+    ]
+
+    # STRICT: Must contain specific media content indicators
+    DEFAULT_MEDIA_INDICATORS = [
+        'op-ed', 'opinion', 'editorial', 'guest column', 'commentary',
+        'interview', 'interviewed', 'speaks with', 'conversation with', 'q&a',
+        'television', 'tv interview', 'news interview', 'appears on', 'discusses',
+        'writes', 'author', 'byline', 'contributed', 'analysis'
+    ]
+
+    # EXCLUDE: Social media, academic papers, irrelevant content.
+    # Entries containing a dot are matched as hostnames, the rest as keywords in URL or text.
+    DEFAULT_EXCLUDE_PATTERNS = [
+        'facebook.com', 'instagram.com', 'tiktok.com', 'twitter.com', 'x.com',
+        'linkedin.com', 'reddit.com', 'youtube.com', 'researchgate.net', 'jstor.org',
+        'academia.edu', 'scholar.google.com', 'arxiv.org', 'ssrn.com',
+        'archive', 'archives', 'course', 'syllabus', 'academic', 'student',
+        'sale', 'shop', 'store', 'product', 'booking', 'hotel', 'travel',
+        'obituary', 'funeral', 'memorial', 'wedding', 'birthday', 'party'
+    ]
+
+    def __init__(self, legitimate_domains: List[str], media_indicators: List[str], exclude_patterns: List[str]):
+        self.legitimate_domains = frozenset(d.lower().strip('.') for d in legitimate_domains)
+        self.excluded_domains = frozenset(p.lower().strip('.') for p in exclude_patterns if '.' in p)
+        self._indicator_re = self.compile_keywords(media_indicators)
+        self._exclude_re = self.compile_keywords([p for p in exclude_patterns if '.' not in p])
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'SourceFilter':
+        """Build from the optional 'filters' config section, falling back to the defaults"""
+        filters = config.get('filters') or {}
+        return cls(
+            filters.get('legitimate_domains') or cls.DEFAULT_LEGITIMATE_DOMAINS,
+            filters.get('media_indicators') or cls.DEFAULT_MEDIA_INDICATORS,
+            filters.get('exclude_patterns') or cls.DEFAULT_EXCLUDE_PATTERNS
+        )
+
+    @staticmethod
+    def compile_keywords(keywords: List[str]) -> Optional['re.Pattern']:
+        """Combine keywords into one alternation, longest first"""
+        unique = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+        if not unique:
+            return None
+        return re.compile('|'.join(re.escape(k) for k in unique))
+
+    @staticmethod
+    def host_in(hostname: str, domains: frozenset) -> bool:
+        """True if the hostname or any parent domain is in the set (news.bbc.com -> bbc.com)"""
+        labels = hostname.lower().rstrip('.').split('.')
+        return any('.'.join(labels[i:]) in domains for i in range(len(labels)))
+
+    def is_relevant(self, url: str, title: str, snippet: str) -> bool:
+        try:
+            hostname = urllib.parse.urlparse(url).hostname or ''
+        except ValueError:
+            return False
+        
+        if not self.host_in(hostname, self.legitimate_domains):
+            return False
+        
+        content_lower = f"{title} {snippet}".lower()
+        if self._indicator_re is None or not self._indicator_re.search(content_lower):
+            return False
+        
+        if self.host_in(hostname, self.excluded_domains):
+            return False
+        
+        if self._exclude_re is not None and self._exclude_re.search(f"{url.lower()}\n{content_lower}"):
+            return False
+        
+        return True
+
+
+class DateExtractor:
+    """Precompiled publication-date matcher for the configured search period"""
+
+    MONTH_ABBRS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+    def __init__(self, start: date, end: date):
+        self.start = start
+        self.end = end
+        
+        # Only months and years that occur in the period are worth matching
+        months, years = [], []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            if month not in months:
+                months.append(month)
+            if year not in years:
+                years.append(year)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        
+        month_names = '|'.join(self.MONTH_ABBRS[m - 1] for m in sorted(months))
+        month_numbers = '|'.join(f"0?{m}" if m < 10 else str(m) for m in sorted(months))
+        year_numbers = '|'.join(str(y) for y in sorted(years))
+        self.year_strings = tuple(str(y) for y in sorted(years))
+        self.pattern = re.compile(
+            rf"\b(?P<mname>{month_names})[a-z]*\.?\s+(?P<mday>\d{{1,2}}),?\s+(?P<myear>{year_numbers})\b"
+            rf"|\b(?P<nmonth>{month_numbers})[/-](?P<nday>\d{{1,2}})[/-](?P<nyear>{year_numbers})\b"
+            rf"|\b(?P<iyear>{year_numbers})-(?P<imonth>{month_numbers})-(?P<iday>\d{{1,2}})\b",
+            re.IGNORECASE
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'DateExtractor':
+        period = config['search_period']
+        return cls(
+            datetime.strptime(period['start_date'], '%Y-%m-%d').date(),
+            datetime.strptime(period['end_date'], '%Y-%m-%d').date()
+        )
+
+    def parse_match(self, match: 're.Match') -> Optional[date]:
+        """Convert a regex match to a date, or None if it is not a real calendar date"""
+        try:
+            if match.group('mname'):
+                month = self.MONTH_ABBRS.index(match.group('mname').title()) + 1
+                return date(int(match.group('myear')), month, int(match.group('mday')))
+            if match.group('nmonth'):
+                return date(int(match.group('nyear')), int(match.group('nmonth')), int(match.group('nday')))
+            return date(int(match.group('iyear')), int(match.group('imonth')), int(match.group('iday')))
+        except ValueError:
+            return None
+
+    def in_range(self, value: date) -> bool:
+        return self.start <= value <= self.end
+
+    def extract(self, text: str) -> Optional[date]:
+        """First date in the text that falls inside the period"""
+        # Every supported format contains the year; a substring check is far cheaper than the regex
+        if not any(year in text for year in self.year_strings):
+            return None
+        for match in self.pattern.finditer(text):
+            value = self.parse_match(match)
+            if value is not None and self.in_range(value):
+                return value
+        return None
+
+    def extract_many(self, texts: List[str]) -> List[Optional[date]]:
+        """Extract dates for a whole batch of result texts"""
+        extract = self.extract
+        return [extract(text) for text in texts]
+
+    @staticmethod
+    def parse_timestamp(value: str) -> Optional[date]:
+        """Date of a metadata timestamp: ISO 8601 ('2025-07-03T10:00:00Z') or RFC 2822"""
+        value = value.strip()
+        match = re.match(r'(\d{4})-(\d{2})-(\d{2})', value)
+        try:
+            if match:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            from email.utils import parsedate_to_datetime
+            return parsedate_to_datetime(value).date()
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def format(value: date) -> str:
+        """Report format, e.g. 'Jul 3, 2025'"""
+        return f"{value:%b} {value.day}, {value.year}"
+
+
+class MediaHit:
+    """One article found for a faculty member, used from the backends through to the reports
+
+    Slotted, with the faculty, source and search method strings interned, so a
+    multi-year backfill keeps one copy of each instead of one per hit.
+    """
+
+    __slots__ = ('faculty_name', 'faculty_names', 'title', 'url', 'snippet', 'source', 'author',
+                 'published', 'search_method')
+
+    def __init__(self, faculty_name: str, title: str, url: str, snippet: str, source: str,
+                 published: Optional[date], search_method: str = 'Unknown', author: str = '',
+                 faculty_names: Optional[List[str]] = None):
+        self.faculty_name = sys.intern(faculty_name)
+        # Every faculty member credited with the article, once co-authored copies are merged
+        self.faculty_names = [sys.intern(name) for name in faculty_names] if faculty_names else [self.faculty_name]
+        self.title = title
+        self.url = url
+        self.snippet = snippet
+        self.source = sys.intern(source)
+        self.author = author
+        self.published = published
+        self.search_method = sys.intern(search_method)
+
+    @property
+    def publication_date(self) -> str:
+        """Publication date in report format, e.g. 'Jul 3, 2025'"""
+        return DateExtractor.format(self.published) if self.published else ''
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form (dates as ISO strings)"""
+        record = {name: getattr(self, name) for name in self.__slots__}
+        record['published'] = self.published.isoformat() if self.published else None
+        return record
+
+    @classmethod
+    def from_dict(cls, record: Dict) -> 'MediaHit':
+        published = record.get('published')
+        return cls(
+            record['faculty_name'], record['title'], record['url'], record['snippet'], record['source'],
+            date.fromisoformat(published) if published else None,
+            record.get('search_method') or 'Unknown', record.get('author') or '', record.get('faculty_names')
+        )
+
+    def __repr__(self) -> str:
+        return f"MediaHit({self.faculty_name!r}, {self.title!r}, {self.url!r}, {self.publication_date!r})"
+
+
+class FacultyNameMatcher:
+    """Finds mentions of any roster member in text with one compiled regex"""
+
+    NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+    def __init__(self, faculty_names: List[str]):
+        self.faculty_names = list(dict.fromkeys(faculty_names))
+        self._patterns = {}
+        groups = []
+        for index, name in enumerate(self.faculty_names):
+            body = self.name_pattern(name)
+            self._patterns[name] = re.compile(rf"\b(?:{body})\b")
+            groups.append(f"(?P<f{index}>{body})")
+        self.pattern = re.compile(r"\b(?:" + "|".join(groups) + r")\b") if groups else None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase, strip diacritics and treat hyphens and dashes as spaces"""
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text)
+            text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+            text = text.replace('\u2010', ' ').replace('\u2011', ' ').replace('\u2013', ' ').replace('\u2014', ' ')
+        return text.lower().replace('-', ' ')
+
+    @classmethod
+    def name_pattern(cls, faculty_name: str) -> str:
+        """Regex body matching the common ways a name appears in bylines and snippets"""
+        tokens = [t for t in cls.normalize(faculty_name).replace('.', ' ').split() if t not in cls.NAME_SUFFIXES]
+        if len(tokens) < 2:
+            return re.escape(' '.join(tokens)) or r'(?!x)x'
+        
+        first, last = re.escape(tokens[0]), re.escape(tokens[-1])
+        # Hyphenated surnames are normalized to spaces, so "Ghaffar-Kucher" arrives as two tokens
+        surname_parts = faculty_name.split()[-1].count('-') + 1
+        surname = r'\s+'.join(re.escape(t) for t in tokens[-surname_parts:])
+        # Up to two middle names or initials ("Alexander A. Reinert", "Natsu Taylor Saito")
+        middle = r"(?:\w+\.?\s+){0,2}"
+        
+        variants = [rf"{first}\.?\s+{middle}{surname}"]
+        if surname_parts > 1:
+            variants.append(rf"{first}\s+{middle}{last}")
+        if len(tokens[0]) == 1 and len(tokens) > 2:
+            # Initial-first names usually appear without it ("D. Asher Ghertner" -> "Asher Ghertner")
+            variants.append(rf"{re.escape(tokens[1])}\s+{surname}")
+        # No bare "Prof. Surname" form: Khan, Ali or Jones alone names far more people than our faculty,
+        # and "Prof. Adil Haque" is already matched above since the title just precedes the name
+        return '|'.join(variants)
+
+    def matches(self, faculty_name: str, text: str) -> bool:
+        """True if this faculty member is mentioned in the text"""
+        pattern = self._patterns.get(faculty_name)
+        if pattern is None:
+            pattern = self._patterns[faculty_name] = re.compile(rf"\b(?:{self.name_pattern(faculty_name)})\b")
+        return pattern.search(self.normalize(text)) is not None
+
+    def scan(self, text: str) -> List[str]:
+        """All roster members mentioned in the text, in order of first mention"""
+        if self.pattern is None:
+            return []
+        found = []
+        for match in self.pattern.finditer(self.normalize(text)):
+            name = self.faculty_names[int(match.lastgroup[1:])]
+            if name not in found:
+                found.append(name)
+        return found
+
+
+class DuplicateIndex:
+    """Clusters results that are the same article: by canonical URL, then by SimHash
+
+    Canonical URLs catch tracking parameters, AMP pages and http/https or www variants;
+    a 64-bit SimHash of title + snippet catches syndicated copies on other outlets. Both
+    lookups are hash based (LSH bands for SimHash), so add() is O(1) per result.
+    """
+
+    TRACKING_PARAMS = frozenset({
+        'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'smid', 'smtyp', 'cmpid', 'ocid',
+        'ref', 'ref_src', 'taid', 'amp', 'amp_js_v', 'usqp', 'outputtype', '__twitter_impression'
+    })
+    HOST_PREFIXES = ('www.', 'amp.', 'm.', 'mobile.')
+    BANDS = 4  # 4 bands of 16 bits: any two hashes within 3 bits share at least one band
+    TOKEN = re.compile(r"[a-z0-9]+")
+    TITLE_SUFFIX = re.compile(r"\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]{1,60}$")
+    # Each byte value spread into eight 16-bit lanes, so bit columns are summed 8 bits at a time
+    SPREAD = [sum(1 << (16 * i) for i in range(8) if b >> i & 1) for b in range(256)]
+
+    def __init__(self, near_duplicates: bool = True, max_distance: int = 3, min_words: int = 6,
+                 names_in: Optional[Callable[[str], List[str]]] = None):
+        self.near_duplicates = near_duplicates
+        # Texts that differ only in who they name are different articles, so near-duplicates
+        # must mention the same faculty (names_in returns the roster names found in a text)
+        self.names_in = names_in
+        self.max_distance = min(max_distance, self.BANDS - 1)
+        self.min_words = min_words
+        self.by_url = {}
+        self.buckets = {}
+
+    @classmethod
+    def canonicalize(cls, url: str) -> str:
+        """Canonical form of an article URL for duplicate detection (not for display)"""
+        parts = urllib.parse.urlsplit(url.strip())
+        host = (parts.hostname or '').lower()
+        path = parts.path
+        
+        # Google AMP cache: https://www-example-com.cdn.ampproject.org/c/s/www.example.com/story
+        if host.endswith('.cdn.ampproject.org'):
+            match = re.match(r'/[a-z]/(?:s/)?([^/]+)(/.*)?$', path)
+            if match:
+                host, path = match.group(1).lower(), match.group(2) or '/'
+        for prefix in cls.HOST_PREFIXES:
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+                break
+        
+        path = re.sub(r'^/amp(?=/)', '', path)
+        path = re.sub(r'/amp/?$', '', path)
+        path = re.sub(r'\.amp(\.html?)$', r'\1', path)
+        path = re.sub(r'/{2,}', '/', path).rstrip('/') or '/'
+        
+        query = sorted(
+            (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in cls.TRACKING_PARAMS
+        )
+        return urllib.parse.urlunsplit(('https', host, path, urllib.parse.urlencode(query), ''))
+
+    @classmethod
+    @lru_cache(maxsize=65536)
+    def simhash(cls, title: str, snippet: str, min_words: int = 6) -> Optional[int]:
+        """64-bit SimHash over word bigrams, or None if the text is too short to compare"""
+        # "Headline - The Outlet" and "Headline | Outlet" should hash alike
+        title = cls.TITLE_SUFFIX.sub('', title)
+        words = cls.TOKEN.findall(FacultyNameMatcher.normalize(f"{title} {snippet}"))
+        if len(words) < min_words:
+            return None
+        features = {
+            int.from_bytes(hashlib.blake2b(f"{a} {b}".encode('utf-8'), digest_size=8).digest(), 'big')
+            for a, b in zip(words, words[1:])
+        }
+        
+        spread = cls.SPREAD
+        columns = 0
+        for feature in features:
+            for k in range(8):
+                columns += spread[(feature >> (8 * k)) & 0xFF] << (128 * k)
+        
+        half = len(features) / 2
+        value = 0
+        for bit in range(64):
+            if (columns >> (16 * bit)) & 0xFFFF > half:
+                value |= 1 << bit
+        return value
+
+    def bands(self, value: int) -> List[Tuple[int, int]]:
+        width = 64 // self.BANDS
+        mask = (1 << width) - 1
+        return [(band, (value >> (band * width)) & mask) for band in range(self.BANDS)]
+
+    def same_names(self, result: MediaHit, other: MediaHit) -> bool:
+        if self.names_in is None:
+            return True
+        text = f"{result.title} {result.snippet}"
+        other_text = f"{other.title} {other.snippet}"
+        return set(self.names_in(text)) == set(self.names_in(other_text))
+
+    def add(self, result: MediaHit) -> Optional[MediaHit]:
+        """Index a result; returns the earlier record it duplicates, or None if it is new"""
+        url_key = self.canonicalize(result.url)
+        existing = self.by_url.get(url_key)
+        if existing is not None:
+            return existing
+        
+        signature = None
+        if self.near_duplicates:
+            signature = self.simhash(result.title, result.snippet, self.min_words)
+        if signature is not None:
+            bands = self.bands(signature)
+            for band in bands:
+                for other_signature, other in self.buckets.get(band, ()):
+                    if bin(signature ^ other_signature).count('1') <= self.max_distance and self.same_names(result, other):
+                        self.by_url[url_key] = other
+                        return other
+            for band in bands:
+                self.buckets.setdefault(band, []).append((signature, result))
+        
+        self.by_url[url_key] = result
+        return None
+
+
+class Metrics:
+    """Thread-safe run counters and timers, exported as JSON lines or a Prometheus textfile"""
+
+    def __init__(self, jsonl_path: Optional[str] = None, prefix: str = 'csrr_tracker'):
+        self.jsonl_path = jsonl_path
+        self.prefix = prefix
+        self.counters = {}  # (name, labels) -> value
+        self.timers = {}    # (name, labels) -> [count, total_seconds, max_seconds]
+        self._jsonl = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def label_key(labels: Dict) -> Tuple:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def increment(self, name: str, value: float = 1, **labels):
+        key = (name, self.label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record one timing and emit it as a JSON line"""
+        key = (name, self.label_key(labels))
+        with self._lock:
+            stats = self.timers.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+        self.emit({'type': 'timer', 'name': name, 'labels': labels, 'seconds': round(seconds, 6)})
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def emit(self, event: Dict):
+        if not self.jsonl_path:
+            return
+        line = json.dumps(dict(event, ts=round(time.time(), 3)))
+        with self._lock:
+            if self._jsonl is None:
+                self._jsonl = open(self.jsonl_path, 'a', encoding='utf-8')
+            self._jsonl.write(line + '\n')
+
+    def snapshot(self) -> Dict:
+        """Counters and timer aggregates as plain data"""
+        with self._lock:
+            return {
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                'timers': [
+                    {'name': name, 'labels': dict(labels), 'count': count,
+                     'total_seconds': round(total, 6), 'max_seconds': round(maximum, 6)}
+                    for (name, labels), (count, total, maximum) in sorted(self.timers.items())
+                ]
+            }
+
+    def counter_total(self, name: str, **labels) -> float:
+        """Sum of a counter over all label sets that include the given labels"""
+        wanted = set(self.label_key(labels))
+        with self._lock:
+            return sum(v for (n, key), v in self.counters.items() if n == name and wanted <= set(key))
+
+    def write_prometheus(self, path: str):
+        """Write the node_exporter textfile format atomically"""
+        def fmt_labels(labels: Tuple) -> str:
+            if not labels:
+                return ''
+            escaped = (
+                (k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for k, v in labels
+            )
+            return '{' + ','.join(f'{k}="{v}"' for k, v in escaped) + '}'
+        
+        lines, declared = [], set()
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                metric = f"{self.prefix}_{name}_total"
+                if metric not in declared:
+                    declared.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{fmt_labels(labels)} {value}")
+            for (name, labels), (count, total, _) in sorted(self.timers.items()):
+                metric = f"{self.prefix}_{name}_seconds"
+                if metric not in declared:
+                    declared.add(metric)
+                    lines.append(f"# TYPE {metric} summary")
+                lines.append(f"{metric}_count{fmt_labels(labels)} {count}")
+                lines.append(f"{metric}_sum{fmt_labels(labels)} {total:.6f}")
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+
+    def close(self):
+        """Emit a final summary line and close the JSON lines file"""
+        self.emit(dict(self.snapshot(), type='summary'))
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+
+
+class PlannedQuery(NamedTuple):
+    query: str
+    faculty_names: List[str]
+
+
+class QueryPlanner:
+    """Packs search-term variants for one or more faculty into boolean OR queries"""
+
+    DEFAULT_TERMS = [
+        # Op-eds and opinion pieces
+        'op-ed', 'opinion piece', 'editorial', 'opinion', 'guest column', 'commentary',
+        # Print interviews
+        'interview', 'interviewed', 'speaks with', 'Q&A', 'conversation with',
+        # Television interviews
+        'television', 'TV interview', 'news interview',
+        'CNN', 'MSNBC', 'Fox News', 'PBS', 'ABC', 'CBS', 'NBC'
+    ]
+
+    # Date operators BingHTMLBackend appends to each query; the planner leaves room for them
+    DATE_SUFFIX = " after:{start_date} before:{end_date}"
+    DATE_SUFFIX_WORDS = len(DATE_SUFFIX.split())
+    DATE_SUFFIX_LENGTH = len(DATE_SUFFIX.format(start_date='YYYY-MM-DD', end_date='YYYY-MM-DD'))
+
+    def __init__(self, terms: Optional[List[str]] = None, max_words: int = 32, max_length: int = 2048,
+                 max_queries: int = 0, reserved_words: int = 0, reserved_length: int = 0):
+        self.terms = [self.quote(t) for t in (terms or self.DEFAULT_TERMS)]
+        self.max_words = int(max_words or 0)  # 0 means no limit
+        self.max_length = int(max_length or 0)
+        self.max_queries = int(max_queries or 0)
+        self.reserved_words = reserved_words
+        self.reserved_length = reserved_length
+
+    @staticmethod
+    def quote(term: str) -> str:
+        return f'"{term}"' if ' ' in term else term
+
+    @staticmethod
+    def faculty_clause(faculty_names: List[str]) -> str:
+        quoted = [f'"{name}"' for name in faculty_names]
+        return quoted[0] if len(quoted) == 1 else f"({' OR '.join(quoted)})"
+
+    @staticmethod
+    def render(prefix: str, terms: List[str]) -> str:
+        return f"{prefix} {terms[0]}" if len(terms) == 1 else f"{prefix} ({' OR '.join(terms)})"
+
+    def fits(self, query: str) -> bool:
+        if self.max_words and len(query.split()) + self.reserved_words > self.max_words:
+            return False
+        if self.max_length and len(query) + self.reserved_length > self.max_length:
+            return False
+        return True
+
+    def plan(self, faculty_names: List[str]) -> List[PlannedQuery]:
+        """Greedily pack every term into as few queries as the backend's limits allow"""
+        prefix = self.faculty_clause(faculty_names)
+        queries, batch = [], []
+        for term in self.terms:
+            if batch and not self.fits(self.render(prefix, batch + [term])):
+                queries.append(PlannedQuery(self.render(prefix, batch), list(faculty_names)))
+                batch = []
+            batch.append(term)
+        if batch:
+            queries.append(PlannedQuery(self.render(prefix, batch), list(faculty_names)))
+        return queries[:self.max_queries] if self.max_queries else queries
+
+
+class RequestsTransport:
+    """Blocking transport over a shared requests.Session (the default)"""
+
+    name = 'requests'
+
+    def __init__(self, session):
+        self.session = session
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None):
+        return self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+    def head(self, url: str, timeout: Optional[float] = None):
+        return self.session.head(url, allow_redirects=True, timeout=timeout)
+
+    def get_prefix(self, url: str, max_bytes: int, stop: Optional[bytes] = None,
+                   headers: Optional[Dict] = None, timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """Stream the start of a body, closing the connection after max_bytes or once `stop` is seen"""
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            content = bytearray()
+            for chunk in response.iter_content(8192):
+                content += chunk
+                if len(content) >= max_bytes or (stop and stop in content.lower()):
+                    break
+            return response.status_code, bytes(content[:max_bytes])
+
+    def close(self):
+        pass
+
+
+class AsyncTransport:
+    """Pooled asyncio transport (httpx, HTTP/2 when available) driven from a background event loop
+
+    Worker threads call get() as usual; requests from every thread are multiplexed over
+    one keep-alive pool with a per-host concurrency cap, so network latency overlaps.
+    """
+
+    name = 'async'
+
+    def __init__(self, headers: Dict[str, str], timeout: float = 15, connect_timeout: float = 5,
+                 retries: int = 2, max_connections: int = 50, per_host_limit: int = 8, http2: bool = True):
+        import asyncio
+        import httpx
+        try:
+            import h2  # noqa: F401  (httpx only needs it importable for HTTP/2)
+        except ImportError:
+            http2 = False
+        self.http2 = http2
+        self.retries = retries
+        self.per_host_limit = per_host_limit
+        self._host_semaphores = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='async-transport', daemon=True)
+        self._thread.start()
+        
+        async def create_client():
+            return httpx.AsyncClient(
+                headers=headers,
+                http2=http2,
+                follow_redirects=True,
+                timeout=httpx.Timeout(timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            )
+        self._client = asyncio.run_coroutine_threadsafe(create_client(), self._loop).result()
+
+    async def fetch(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                    timeout: Optional[float] = None):
+        """GET on the event loop, capped per host and retried on connection errors"""
+        import asyncio
+        import httpx
+        kwargs = {'params': params, 'headers': headers}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        async with self.host_semaphore(url):
+            for attempt in range(self.retries + 1):
+                try:
+                    return await self._client.get(url, **kwargs)
+                except httpx.TransportError:
+                    if attempt == self.retries:
+                        raise
+                    await asyncio.sleep(0.5 * (2 ** attempt))
+
+    def host_semaphore(self, url: str):
+        """Per-host concurrency cap (only touched from the event loop thread)"""
+        import asyncio
+        host = urllib.parse.urlparse(url).hostname or ''
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return semaphore
+
+    async def fetch_prefix(self, url: str, max_bytes: int, stop: Optional[bytes] = None,
+                           headers: Optional[Dict] = None, timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """Stream the start of a body on the event loop, stopping after max_bytes or `stop`"""
+        kwargs = {'headers': headers}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        async with self.host_semaphore(url):
+            async with self._client.stream('GET', url, **kwargs) as response:
+                content = bytearray()
+                chunks = response.aiter_bytes()
+                try:
+                    async for chunk in chunks:
+                        content += chunk
+                        if len(content) >= max_bytes or (stop and stop in content.lower()):
+                            break
+                finally:
+                    await chunks.aclose()
+                return response.status_code, bytes(content[:max_bytes])
+
+    async def fetch_head(self, url: str, timeout: Optional[float] = None):
+        kwargs = {'timeout': timeout} if timeout is not None else {}
+        async with self.host_semaphore(url):
+            return await self._client.head(url, **kwargs)
+
+    def head(self, url: str, timeout: Optional[float] = None):
+        import asyncio
+        return asyncio.run_coroutine_threadsafe(self.fetch_head(url, timeout), self._loop).result()
+
+    def get_prefix(self, url: str, max_bytes: int, stop: Optional[bytes] = None,
+                   headers: Optional[Dict] = None, timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        import asyncio
+        coroutine = self.fetch_prefix(url, max_bytes, stop, headers, timeout)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None):
+        """Blocking wrapper so existing callers and worker threads can use the pool"""
+        import asyncio
+        future = asyncio.run_coroutine_threadsafe(self.fetch(url, params, headers, timeout), self._loop)
+        return future.result()
+
+    def get_many(self, urls: List[str], timeout: Optional[float] = None) -> List:
+        """Fetch many URLs concurrently; failed fetches come back as the exception"""
+        import asyncio
+        async def gather():
+            return await asyncio.gather(*(self.fetch(u, timeout=timeout) for u in urls), return_exceptions=True)
+        return asyncio.run_coroutine_threadsafe(gather(), self._loop).result()
+
+    def close(self):
+        import asyncio
+        if self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+
+class SearchBackend(abc.ABC):
+    """A search engine the tracker can fan a query plan out to
+
+    Subclasses set `name` (the key for rate_limits, query_planner and backends config)
+    and `search_method` (the label in reports), and implement enabled() and search().
+    Filtering and dating go through the tracker so every backend yields the same records.
+    """
+
+    name = ''
+    search_method = ''
+    date_in_query = False  # Whether the planner must leave room for an after:/before: suffix
+
+    def __init__(self, tracker: 'EnhancedFacultyMediaTracker'):
+        self.tracker = tracker
+
+    @property
+    def settings(self) -> Dict:
+        return self.tracker.config['backends'].get(self.name) or {}
+
+    def latency_budget(self) -> float:
+        """Seconds this backend may spend on one faculty group (0 = unlimited)"""
+        budget = self.settings.get('latency_budget')
+        if budget is None:
+            budget = self.tracker.config['backends'].get('latency_budget', 0)
+        return float(budget or 0)
+
+    @abc.abstractmethod
+    def enabled(self) -> bool:
+        """Whether the backend is switched on and has the credentials it needs"""
+
+    @abc.abstractmethod
+    def search(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
+        """Results for one planned query, already screened and dated through the tracker
+
+        Errors propagate, so run_backend can tell a failed query from one with no hits.
+        """
+
+
+class GoogleCSEBackend(SearchBackend):
+    """Google Custom Search JSON API"""
+
+    name = 'google_api'
+    search_method = 'Google API'
+    url = "https://www.googleapis.com/customsearch/v1"
+
+    def enabled(self) -> bool:
+        tracker = self.tracker
+        return bool(tracker.config['search']['use_google_api'] and tracker.google_api_key and tracker.google_cse_id)
+
+    def search(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
+        """Page through Custom Search results until a page has nothing relevant"""
+        tracker = self.tracker
+        if not tracker.google_api_key or not tracker.google_cse_id:
+            return []
+
+        # Restrict to the search period by date range rather than dateRestrict's rolling window
+        start_date = tracker.config['search_period']['start_date'].replace('-', '')
+        end_date = tracker.config['search_period']['end_date'].replace('-', '')
+
+        num = min(tracker.config['search']['max_results_per_query'], 10)  # Google API max is 10
+        max_pages = max(1, int(tracker.config['search'].get('google_max_pages', 1) or 1))
+        results = []
+
+        for page in range(max_pages):
+            start = 1 + page * num
+            if start + num - 1 > 100:
+                break  # Custom Search never returns results past the 100th
+
+            params = {
+                'key': tracker.google_api_key,
+                'cx': tracker.google_cse_id,
+                'q': query,
+                'num': num,
+                'start': start,
+                'sort': f"date:r:{start_date}:{end_date}"
+            }
+
+            try:
+                content = tracker.cached_get(self.name, query, self.url, extra=f"{num}:{start}", params=params,
+                                             timeout=tracker.config['transport'].get('timeout', 15))
+                if content is None:
+                    break
+
+                data = json.loads(content)
+                kept, pub_dates = tracker.screen_candidates(self.parse(data), faculty_names, self.search_method)
+            except Exception as e:
+                if not results:
+                    raise
+                # Stop paging but keep the earlier pages' hits; the query still counts as incomplete
+                raise PartialResults(results) from e
+            results.extend(tracker.dated_results(kept, self.search_method, pub_dates))
+            tracker.metrics.increment('google_pages', page=page + 1)
+
+            # Deeper pages are only worth the quota while this one still had relevant hits
+            if not kept or 'nextPage' not in data.get('queries', {}):
+                break
+
+        return results
+
+    @staticmethod
+    def parse(data: Dict) -> List[Tuple[str, str, str]]:
+        """(title, url, snippet) for each item of a Custom Search response"""
+        return [
+            (item.get('title', ''), item.get('link', ''), item.get('snippet', ''))
+            for item in data.get('items', [])
+        ]
+
+
+class BingHTMLBackend(SearchBackend):
+    """Scraped Bing results page (no API key needed)"""
+
+    name = 'basic_web'
+    search_method = 'Basic Web'
+    date_in_query = True
+
+    def enabled(self) -> bool:
+        return bool(self.tracker.config['search']['use_basic_search'])
+
+    def search(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
+        tracker = self.tracker
+        start_date = tracker.config['search_period']['start_date']
+        end_date = tracker.config['search_period']['end_date']
+        date_query = query + QueryPlanner.DATE_SUFFIX.format(start_date=start_date, end_date=end_date)
+
+        count = tracker.config['search']['max_results_per_query']
+        url = f"https://www.bing.com/search?q={urllib.parse.quote(date_query)}&count={count}"
+
+        content = tracker.cached_get(self.name, query, url, extra=str(count),
+                                     timeout=tracker.config['transport'].get('timeout', 15))
+        if content is None:
+            return []
+
+        # Parsed together with the filters, in a worker process if search.parse_workers is set
+        return tracker.build_results(content, faculty_names, self.search_method, kind='bing_html')
+
+    @staticmethod
+    def parse(content: bytes, limit: int, use_lxml: bool = True) -> List[Tuple[str, str, str]]:
+        """(title, url, snippet) for the first `limit` results of a Bing results page"""
+        candidates = []
+
+        if use_lxml:
+            tree = optional_import('lxml.html').fromstring(content)
+            results = tree.xpath("//li[contains(concat(' ', normalize-space(@class), ' '), ' b_algo ')]")
+            for result in results[:limit]:
+                title_link = result.xpath('(.//h2)[1]//a[1]')
+                if not title_link:
+                    continue
+                title = ' '.join(title_link[0].text_content().split())
+                link = title_link[0].get('href', '')
+                snippet_elem = result.xpath('(.//p)[1]')
+                snippet = ' '.join(snippet_elem[0].text_content().split()) if snippet_elem else ''
+                candidates.append((title, link, snippet))
+            return candidates
+
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'html.parser')
+        for result in soup.find_all('li', class_='b_algo')[:limit]:
+            title_elem = result.find('h2')
+            if not title_elem:
+                continue
+
+            title_link = title_elem.find('a')
+            if not title_link:
+                continue
+
+            # Collapse whitespace rather than get_text(strip=True), which glues "<b>Name</b>writes" together
+            title = ' '.join(title_link.get_text().split())
+            link = title_link.get('href', '')
+
+            snippet_elem = result.find('p')
+            snippet = ' '.join(snippet_elem.get_text().split()) if snippet_elem else ''
+            candidates.append((title, link, snippet))
+        return candidates
+
+
+class StubBackend(SearchBackend):
+    """Replays a saved Custom Search JSON response, for testing and offline runs
+
+    If `recorded_name` is set, that name in the fixture is replaced with the first
+    faculty member being searched, so every query gets realistic hits.
+    """
+
+    name = 'stub'
+    search_method = 'Stub'
+
+    def __init__(self, tracker: 'EnhancedFacultyMediaTracker'):
+        super().__init__(tracker)
+        self._fixture = None
+
+    def enabled(self) -> bool:
+        return bool(self.settings.get('enabled') and self.settings.get('fixture'))
+
+    def search(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
+        settings = self.settings
+        if self._fixture is None:
+            with open(settings['fixture'], 'r', encoding='utf-8') as f:
+                self._fixture = f.read()
+        if settings.get('latency_ms'):
+            time.sleep(settings['latency_ms'] / 1000.0)
+
+        body = self._fixture
+        recorded_name = settings.get('recorded_name')
+        if recorded_name and faculty_names:
+            body = body.replace(recorded_name, faculty_names[0])
+
+        candidates = GoogleCSEBackend.parse(json.loads(body))
+        return self.tracker.build_results(candidates, faculty_names, self.search_method)
+
+
+class ArticleEnricher:
+    """Reads just the <head> of article pages for publication date and byline metadata
+
+    Pages are fetched concurrently through the tracker's transport: an optional HEAD
+    request weeds out dead links and non-HTML files, then a ranged, streamed GET stops
+    at </head>. Results (including "nothing found") are cached per URL.
+    """
+
+    DATE_META = ('article:published_time', 'og:article:published_time', 'datepublished', 'pubdate',
+                 'publishdate', 'publish-date', 'parsely-pub-date', 'sailthru.date', 'dc.date.issued', 'dc.date')
+    AUTHOR_META = ('author', 'article:author', 'byl', 'parsely-author', 'sailthru.author', 'dc.creator')
+
+    def __init__(self, tracker: 'EnhancedFacultyMediaTracker'):
+        settings = tracker.config['enrichment']
+        self.tracker = tracker
+        self.max_workers = max(1, int(settings.get('max_workers', 8) or 1))
+        self.max_bytes = int(settings.get('max_bytes', 65536) or 65536)
+        self.timeout = settings.get('timeout', 10)
+        self.head_first = settings.get('head_first', True)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def enrich(self, urls: List[str]) -> Dict[str, Dict]:
+        """Metadata for each distinct URL, fetched in parallel"""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='enrich')
+        with self.tracker.metrics.timer('enrich'):
+            return dict(zip(urls, self._pool.map(self.metadata, urls)))
+
+    def metadata(self, url: str) -> Dict:
+        """{'published': timestamp or None, 'author': name or None} for one article, cached"""
+        cache, key = self.tracker.cache, None
+        if cache is not None:
+            key = QueryCache.make_key('article', url, '', '')
+            content = cache.get(key)
+            if content is not None:
+                self.tracker.metrics.increment('article_fetches', result='cached')
+                return json.loads(content)
+
+        try:
+            metadata = self.fetch(url)
+        except Exception as e:
+            # Network errors may be transient, so they are not cached
+            self.tracker.metrics.increment('article_fetches', result='error')
+            print(f"  ⚠️  Could not read article {url}: {e}")
+            return {}
+
+        if key is not None:
+            cache.put(key, 'article', url, json.dumps(metadata).encode('utf-8'))
+        return metadata
+
+    def fetch(self, url: str) -> Dict:
+        transport = self.tracker.transport
+        if self.head_first:
+            response = transport.head(url, timeout=self.timeout)
+            content_type = response.headers.get('Content-Type', '')
+            # Some sites refuse HEAD outright; only trust it for definite answers
+            if (response.status_code >= 400 and response.status_code not in (403, 405)) or \
+                    (content_type and 'html' not in content_type):
+                self.tracker.metrics.increment('article_fetches', result='skipped')
+                return {}
+
+        status, content = transport.get_prefix(
+            url, self.max_bytes, stop=b'</head>',
+            headers={'Range': f"bytes=0-{self.max_bytes - 1}"}, timeout=self.timeout
+        )
+        self.tracker.metrics.increment('article_fetches', result=str(status))
+        if status >= 400:
+            return {}
+        return self.tracker.parse_article_head(content)
+
+    @classmethod
+    def parse_head(cls, content: bytes, use_lxml: bool = True) -> Dict:
+        """Publication time and author from <meta> tags and JSON-LD in (a prefix of) a page"""
+        meta, scripts = {}, []
+        lxml_html = optional_import('lxml.html') if use_lxml else None
+        if lxml_html is not None and content.strip():
+            tree = lxml_html.fromstring(content)
+            for el in tree.iter('meta'):
+                key = (el.get('property') or el.get('name') or el.get('itemprop') or '').lower()
+                if key and el.get('content') and key not in meta:
+                    meta[key] = el.get('content')
+            scripts = [el.text_content() for el in tree.xpath('//script[@type="application/ld+json"]')]
+        else:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(content, 'html.parser')
+            for el in soup.find_all('meta'):
+                key = (el.get('property') or el.get('name') or el.get('itemprop') or '').lower()
+                if key and el.get('content') and key not in meta:
+                    meta[key] = el.get('content')
+            scripts = [el.get_text() for el in soup.find_all('script', type='application/ld+json')]
+
+        published = next((meta[key] for key in cls.DATE_META if meta.get(key)), None)
+        author = next((meta[key] for key in cls.AUTHOR_META if meta.get(key) and '://' not in meta[key]), None)
+
+        for script in scripts:
+            try:
+                data = json.loads(script)
+            except ValueError:
+                continue
+            for item in cls.json_ld_items(data):
+                published = published or item.get('datePublished')
+                author = author or cls.author_name(item.get('author'))
+
+        if author:
+            author = re.sub(r'^by\s+', '', ' '.join(author.split()), flags=re.IGNORECASE)
+        return {'published': published if isinstance(published, str) else None, 'author': author or None}
+
+    @classmethod
+    def json_ld_items(cls, data) -> Iterator[Dict]:
+        """Every object in a JSON-LD document, including @graph members"""
+        if isinstance(data, list):
+            for item in data:
+                yield from cls.json_ld_items(item)
+        elif isinstance(data, dict):
+            yield data
+            yield from cls.json_ld_items(data.get('@graph', []))
+
+    @classmethod
+    def author_name(cls, value) -> Optional[str]:
+        """JSON-LD author may be a string, a Person object or a list of either"""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict):
+            return value.get('name') if isinstance(value.get('name'), str) else None
+        if isinstance(value, list):
+            names = [cls.author_name(item) for item in value]
+            return ', '.join(name for name in names if name) or None
+        return None
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+
+class ParseWorker:
+    """CPU-bound half of a search: HTML parsing, name matching, source filtering, date extraction
+
+    Runs in worker processes when search.parse_workers is set, so parsing scales with
+    cores while fetching stays on the tracker's threads. Takes raw response bytes (or
+    already parsed candidates) and returns plain tuples that are cheap to send back.
+    """
+
+    def __init__(self, faculty_names: List[str], config: Dict):
+        self.name_matcher = FacultyNameMatcher(faculty_names)
+        self.source_filter = SourceFilter.from_config(config)
+        self.date_extractor = DateExtractor.from_config(config)
+        self.limit = config['search']['max_results_per_query']
+        self.use_lxml = config['search'].get('html_parser', 'lxml') == 'lxml' and optional_import('lxml.html') is not None
+
+    def screen(self, kind: str, payload, faculty_names: List[str]) -> Tuple[List[Tuple[str, str, str, List[str]]], List[Optional[date]], int, int]:
+        """(kept candidates, their snippet dates, candidate count, count naming a faculty member)"""
+        candidates = BingHTMLBackend.parse(payload, self.limit, self.use_lxml) if kind == 'bing_html' else payload
+        mentioned = []
+        for title, link, snippet in candidates:
+            names = [name for name in faculty_names if self.name_matcher.matches(name, f"{title} {snippet}")]
+            if names:
+                mentioned.append((title, link, snippet, names))
+        kept = [c for c in mentioned if self.source_filter.is_relevant(c[1], c[0], c[2])]
+        pub_dates = self.date_extractor.extract_many([f"{c[0]} {c[2]}" for c in kept])
+        return kept, pub_dates, len(candidates), len(mentioned)
+
+    def parse_head(self, content: bytes) -> Dict:
+        return ArticleEnricher.parse_head(content, self.use_lxml)
+
+
+_parse_worker = None  # This process's ParseWorker, set up by init_parse_worker
+
+
+def init_parse_worker(faculty_names: List[str], config: Dict):
+    """Process pool initializer: build the worker once, not on every task"""
+    global _parse_worker
+    _parse_worker = ParseWorker(faculty_names, config)
+
+
+def screen_in_worker(kind: str, payload, faculty_names: List[str]):
+    return _parse_worker.screen(kind, payload, faculty_names)
+
+
+def parse_head_in_worker(content: bytes) -> Dict:
+    return _parse_worker.parse_head(content)
+
+
+class StoreSink:
+    """Pipeline sink: writes each faculty member's new and updated results to the result store"""
+
+    def __init__(self, store: ResultStore, run_id: int):
+        self.store = store
+        self.run_id = run_id
+
+    def write(self, new: List[MediaHit], updated: List[MediaHit]):
+        self.store.add(self.run_id, new + updated)
+
+    def close(self):
+        pass
+
+
+class ProgressCsvSink:
+    """Pipeline sink: appends report rows as each faculty member finishes
+
+    Gives a partial report to look at during a long run. Co-authors merged after a
+    row was written only show up in the final reports.
+    """
+
+    def __init__(self, path: str, columns: List[str], report_rows: Callable[[Iterable[MediaHit]], Iterator[Tuple]]):
+        self.path = path
+        self.report_rows = report_rows
+        self._file = open(path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+        self._file.flush()
+
+    def write(self, new: List[MediaHit], updated: List[MediaHit]):
+        self._writer.writerows(self.report_rows(new))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
 class EnhancedFacultyMediaTracker:
     """Enhanced automated tool for tracking CSRR faculty media appearances"""
     
+    REPORT_COLUMNS = [
+        "Faculty Name", "Title", "Source", "Author", "URL",
+        "Publication Date", "Date Found", "Snippet", "Search Method"
+    ]
+    
     def __init__(self, config_file: str = "config.yaml"):
         self.config = self.load_config(config_file)
+        self.metrics = Metrics(self.config['metrics'].get('jsonl_path'))
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        self.transport = self.create_transport()
         self.results = []
-        
-        # API Configuration
+        self.request_budget = RequestBudget(int(self.config['search'].get('max_requests_per_run', 0) or 0))
+        # API Configuration (read early: daily quotas are counted per API key)
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
         self.google_cse_id = os.getenv("GOOGLE_CSE_ID")
+        self.quota_ledger = None
+        self.rate_limiters = self.create_rate_limiters()
+        self.cache = self.create_cache()
+        self.store = self.create_store()
+        self.journal = None
+        self.faculty_roster = None  # Fetched once per run by fetch_faculty_list
+        self.source_filter = SourceFilter.from_config(self.config)
+        self.date_extractor = DateExtractor.from_config(self.config)
+        self.name_matcher = FacultyNameMatcher([])  # Rebuilt from the roster in run_search
+        self.backends = [GoogleCSEBackend(self), BingHTMLBackend(self), StubBackend(self)]
+        self.query_planners = self.create_query_planners()
+        self.backend_pool = None  # Created on first fan-out to more than one backend
+        self.backend_pool_lock = threading.Lock()
+        self.search_context = threading.local()  # Latency deadline of the backend query running on this thread
+        self.parse_pool = None  # Worker processes for parse + filter (search.parse_workers)
+        self.parse_pool_lock = threading.Lock()
+        self.enricher = ArticleEnricher(self)
+        
+        shard = self.config['shard']
+        if shard.get('index') is not None:
+            self.set_shard(int(shard['index']), int(shard.get('count') or 1))
         
         if not self.google_api_key or not self.google_cse_id:
             print("⚠️  Google API not configured. Using basic search only.")
             print("💡 To enable enhanced search, set GOOGLE_API_KEY and GOOGLE_CSE_ID environment variables")
         
-    def load_config(self, config_file: str) -> Dict:
+    @staticmethod
+    def load_config(config_file: str) -> Dict:
         """Load configuration from YAML file"""
         default_config = {
             'search_period': {
                 'start_date': '2025-06-01',
-                'end_date': '2025-07-31'
+                'end_date': '2025-07-31',
+                # Multi-period mode: one search over the union, one report per window, e.g.
+                # [{'name': 'Jun2025', 'start_date': '2025-06-01', 'end_date': '2025-06-30'}, ...]
+                'periods': []
             },
             'output': {
                 'excel_filename': 'CSRR_Faculty_Media_Report.xlsx',
                 'word_filename': 'CSRR_Faculty_Op-Eds.docx',
                 'include_snippets': True,
                 'max_results_per_faculty': 10,  # Increased for enhanced search
-                'save_to_downloads': True  # New option to save to Downloads folder
+                'save_to_downloads': True,  # New option to save to Downloads folder
+                'extra_formats': [],  # Also write the Excel rows as 'csv' and/or 'parquet' (needs pyarrow)
+                'progress_csv': None  # CSV appended as each faculty member finishes, for a look mid-run
             },
             'search': {
                 'max_results_per_query': 10,  # Increased for Google API
                 'delay_between_searches': 1,  # Reduced for API
                 'use_google_api': True,
                 'use_basic_search': True,  # Fallback
+                'html_parser': 'lxml',  # 'lxml' (fast) or 'html.parser'; falls back if lxml is missing
+                'google_max_pages': 3,  # Custom Search pages per query; stops early on a page with no hits
+                'max_workers': 1,  # Faculty searched in parallel (1 = sequential)
+                'max_requests_per_run': 0,  # Global request budget across workers (0 = unlimited)
+                # Processes for HTML parsing, name matching and date extraction (0 = in the search threads);
+                # pair with max_workers >= parse_workers so enough responses are in flight
+                'parse_workers': 0,
                 'search_types': ['op-ed', 'interview', 'commentary', 'podcast', 'video']
             },
             'faculty': {
                 'auto_fetch_from_website': True,
-                'manual_list': []
+                'manual_list': [],
+                'roster_cache': '.tracker_roster.json',
+                'roster_cache_max_age_hours': 24  # Revalidated with ETag/Last-Modified after this
+            },
+            'rate_limits': {
+                # Custom Search allows 100 queries/minute; daily_quota should match the billing tier
+                'google_api': {'qps': 1.6, 'burst': 1, 'daily_quota': 10000},
+                # Defaults to one request per search.delay_between_searches seconds
+                'basic_web': {'qps': None, 'burst': 1, 'daily_quota': 0},
+                'max_retries': 3,
+                'backoff_base': 2.0,  # Seconds; doubled on every retry
+                'max_backoff': 60.0,
+                # Requests per backend and day are recorded here, so daily_quota holds across runs
+                # (None = count this process only)
+                'quota_path': '.tracker_quota.sqlite'
+            },
+            'cache': {
+                'enabled': True,
+                'path': '.tracker_cache.sqlite',
+                'ttl_hours': 72,
+                'max_entries': 50000
+            },
+            'checkpoint': {
+                'path': '.tracker_checkpoint.jsonl'
+            },
+            'store': {
+                'path': '.tracker_results.sqlite'  # Every run's articles, queried by the reports; None = this run only
+            },
+            'transport': {
+                'backend': 'requests',  # 'async' = pooled httpx client (HTTP/2 if h2 is installed)
+                'timeout': 15,
+                'connect_timeout': 5,
+                'retries': 2,  # Connection-level retries (async only); 429/5xx use rate_limits
+                'max_connections': 50,
+                'per_host_limit': 8,
+                'http2': True
+            },
+            'query_planner': {
+                'terms': None,  # Defaults to QueryPlanner.DEFAULT_TERMS
+                'faculty_per_query': 1,  # >1 packs several faculty into one ("A" OR "B") query
+                'max_queries_per_faculty': 0,  # Cap on packed queries per backend (0 = all)
+                # Custom Search ignores words past 32; Bing truncates long queries
+                'google_api': {'max_words': 32, 'max_length': 2048},
+                'basic_web': {'max_words': 30, 'max_length': 250}
+            },
+            'backends': {
+                # Wall-clock seconds each backend may spend per faculty group (0 = unlimited);
+                # a backend over budget is skipped for that group while the others carry on
+                'latency_budget': 120,
+                'google_api': {'latency_budget': None},  # None = use the shared budget above
+                'basic_web': {'latency_budget': None},
+                'stub': {'enabled': False, 'fixture': None, 'recorded_name': None, 'latency_ms': 0}
+            },
+            'dedup': {
+                'near_duplicates': True,  # Merge syndicated copies by SimHash of title + snippet
+                'max_distance': 3  # Differing bits (of 64) still counted as the same article
+            },
+            'enrichment': {
+                'enabled': False,  # Read article pages for real publication dates and bylines
+                'undated_only': False,  # Only fetch hits whose snippet has no date (fewer requests)
+                'max_workers': 8,
+                'max_bytes': 65536,  # Stop reading at </head> or after this many bytes
+                'timeout': 10,
+                'head_first': True  # HEAD request first to skip dead links and non-HTML files
+            },
+            'shard': {
+                # Search only faculty whose name hashes to shard `index` of `count` (1-based; --shard i/N)
+                'index': None,
+                'count': 1
+            },
+            'metrics': {
+                'jsonl_path': None,  # Timings and a final summary as JSON lines
+                'prometheus_textfile': None  # e.g. /var/lib/node_exporter/csrr_tracker.prom
             }
         }
         
         if os.path.exists(config_file):
+            import yaml
             with open(config_file, 'r') as f:
                 user_config = yaml.safe_load(f) or {}
                 for key, value in user_config.items():
@@ -81,10 +1857,242 @@ class EnhancedFacultyMediaTracker:
                     else:
                         default_config[key] = value
         
-        return default_config
+        return default_config
+    
+    @classmethod
+    def create_default_config(cls, config_file: str) -> bool:
+        """Write the built-in defaults as a starting config.yaml (never overwrites)"""
+        if os.path.exists(config_file):
+            print(f"⚠️  {config_file} already exists, not overwriting")
+            return False
+        import yaml
+        with open(config_file, 'w') as f:
+            yaml.safe_dump(cls.load_config(config_file), f, sort_keys=False)
+        print(f"✅ Configuration file created: {config_file}")
+        return True
+    
+    def create_transport(self):
+        """HTTP transport for the search backends: async pool if configured, else requests"""
+        settings = self.config['transport']
+        if settings.get('backend', 'requests') == 'async':
+            if optional_import('httpx') is None:
+                print("⚠️  httpx not installed, falling back to requests transport")
+            else:
+                return AsyncTransport(
+                    dict(self.session.headers),
+                    timeout=settings.get('timeout', 15),
+                    connect_timeout=settings.get('connect_timeout', 5),
+                    retries=settings.get('retries', 2),
+                    max_connections=settings.get('max_connections', 50),
+                    per_host_limit=settings.get('per_host_limit', 8),
+                    http2=settings.get('http2', True)
+                )
+        return RequestsTransport(self.session)
+    
+    def close(self):
+        """Release network and cache resources"""
+        if self.backend_pool is not None:
+            self.backend_pool.shutdown(wait=False)
+        self.close_parse_pool()
+        self.enricher.close()
+        self.transport.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.quota_ledger is not None:
+            self.quota_ledger.close()
+        self.store.close()
+    
+    def create_rate_limiters(self) -> Dict[str, RateLimiter]:
+        """Build one token bucket per search backend from the rate_limits config"""
+        limits = self.config['rate_limits']
+        delay = self.config['search'].get('delay_between_searches') or 0
+        if self.quota_ledger is None and limits.get('quota_path'):
+            self.quota_ledger = QuotaLedger(limits['quota_path'])
+        limiters = {}
+        for backend in ('google_api', 'basic_web'):
+            settings = limits.get(backend) or {}
+            qps = settings.get('qps')
+            if qps is None:
+                qps = 1.0 / delay if backend == 'basic_web' and delay else 0
+            limiters[backend] = RateLimiter(
+                backend, qps, settings.get('burst', 1), settings.get('daily_quota', 0),
+                ledger=self.quota_ledger, account=self.quota_account(backend)
+            )
+        return limiters
+    
+    def quota_account(self, backend: str) -> str:
+        """Who a backend's daily quota belongs to: a fingerprint of the API key (not the key itself)"""
+        if backend == 'google_api' and self.google_api_key:
+            return hashlib.sha256(self.google_api_key.encode('utf-8')).hexdigest()[:12]
+        return ''
+    
+    def create_query_planners(self) -> Dict[str, QueryPlanner]:
+        """One planner per backend, since each has its own query limits"""
+        settings = self.config['query_planner']
+        planners = {}
+        for backend in self.backends:
+            limits = settings.get(backend.name) or {}
+            # Google restricts dates with the sort parameter; Bing needs after:/before: in the query
+            date_in_query = backend.date_in_query
+            planners[backend.name] = QueryPlanner(
+                settings.get('terms'),
+                max_words=limits.get('max_words', 32),
+                max_length=limits.get('max_length', 2048),
+                max_queries=settings.get('max_queries_per_faculty', 0),
+                reserved_words=QueryPlanner.DATE_SUFFIX_WORDS if date_in_query else 0,
+                reserved_length=QueryPlanner.DATE_SUFFIX_LENGTH if date_in_query else 0
+            )
+        return planners
+    
+    def backend(self, name: str) -> SearchBackend:
+        """Look up a search backend by name"""
+        return next(backend for backend in self.backends if backend.name == name)
+    
+    def create_duplicate_index(self) -> DuplicateIndex:
+        """Empty duplicate index configured from the dedup settings"""
+        settings = self.config['dedup']
+        return DuplicateIndex(
+            settings.get('near_duplicates', True), settings.get('max_distance', 3),
+            names_in=lambda text: self.name_matcher.scan(text)
+        )
+    
+    def create_cache(self) -> Optional[QueryCache]:
+        """Open the on-disk query cache unless disabled in config"""
+        settings = self.config['cache']
+        if not settings.get('enabled', True):
+            return None
+        return QueryCache(
+            settings.get('path', '.tracker_cache.sqlite'),
+            ttl_hours=settings.get('ttl_hours', 72),
+            max_entries=settings.get('max_entries', 50000)
+        )
+    
+    def create_store(self) -> ResultStore:
+        """Result store at the configured path (in memory if none)"""
+        return ResultStore(self.config['store'].get('path'))
+    
+    def cached_get(self, backend: str, query: str, url: str, extra: str = "", **kwargs) -> Optional[bytes]:
+        """Return response content for a search query, from cache when possible"""
+        key = None
+        if self.cache is not None:
+            key = QueryCache.make_key(
+                backend, query,
+                self.config['search_period']['start_date'],
+                self.config['search_period']['end_date'],
+                extra
+            )
+            content = self.cache.get(key)
+            self.metrics.increment('cache_lookups', backend=backend, result='hit' if content is not None else 'miss')
+            if content is not None:
+                return content
+        
+        response = self.rate_limited_get(backend, url, **kwargs)
+        if response is None:
+            return None
+        
+        if key is not None:
+            self.cache.put(key, backend, query, response.content)
+        return response.content
+    
+    def retry_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if given, else exponential backoff"""
+        limits = self.config['rate_limits']
+        max_backoff = float(limits.get('max_backoff', 60.0))
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), max_backoff)
+            except ValueError:
+                try:
+                    from email.utils import parsedate_to_datetime
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return min(max(0.0, retry_at.timestamp() - time.time()), max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        backoff = float(limits.get('backoff_base', 2.0)) * (2 ** attempt)
+        return min(backoff + random.uniform(0, 1), max_backoff)
+    
+    def rate_limited_get(self, backend: str, url: str, **kwargs):
+        """GET through the backend's token bucket, retrying 429/5xx with backoff
+
+        Raises BudgetExhausted when the request budget or daily quota refuses the request
+        (DeadlineExceeded when the rate limiter's queue runs past the latency budget), so
+        callers can tell a search that was never sent from one that found nothing.
+        """
+        limiter = self.rate_limiters[backend]
+        max_retries = int(self.config['rate_limits'].get('max_retries', 3))
+        deadline = getattr(self.search_context, 'deadline', None)
+        
+        for attempt in range(max_retries + 1):
+            if not self.request_budget.acquire() or not limiter.acquire(deadline):
+                self.metrics.increment('requests_denied', backend=backend)
+                raise BudgetExhausted(backend)
+            
+            with self.metrics.timer('http_request', backend=backend, transport=self.transport.name):
+                response = self.transport.get(url, **kwargs)
+            status = response.status_code
+            self.metrics.increment('http_requests', backend=backend, status=status)
+            if (status == 429 or 500 <= status < 600) and attempt < max_retries:
+                self.metrics.increment('http_retries', backend=backend)
+                delay = self.retry_delay(response, attempt)
+                print(f"  ⚠️  {backend} returned {status}, retrying in {delay:.1f}s")
+                limiter.pause(delay)
+                continue
+            
+            response.raise_for_status()
+            return response
+        return None
     
     def fetch_faculty_list(self) -> List[str]:
-        """Fetch faculty list from CSRR website"""
+        """Fetch faculty list from CSRR website (only this shard's part of it in shard mode)"""
+        manual_list = self.config['faculty'].get('manual_list') or []
+        if manual_list:
+            return self.in_shard(manual_list)
+        
+        if self.faculty_roster is None:
+            self.faculty_roster = self.load_faculty_roster()
+        return self.in_shard(self.faculty_roster)
+    
+    def set_shard(self, index: int, count: int):
+        """Search only shard `index` of `count`, with that shard's API credentials if they are set
+
+        GOOGLE_API_KEY_SHARD_<index> and GOOGLE_CSE_ID_SHARD_<index> override the usual
+        variables, so each shard can bill a different key and quota.
+        """
+        if not 1 <= index <= count:
+            raise ValueError(f"Shard {index}/{count} is out of range")
+        self.config['shard'] = {'index': index, 'count': count}
+        self.google_api_key = os.getenv(f"GOOGLE_API_KEY_SHARD_{index}") or self.google_api_key
+        self.google_cse_id = os.getenv(f"GOOGLE_CSE_ID_SHARD_{index}") or self.google_cse_id
+        self.rate_limiters['google_api'].account = self.quota_account('google_api')
+    
+    def shard(self) -> Optional[Tuple[int, int]]:
+        """(index, count) in shard mode, else None"""
+        settings = self.config['shard']
+        if settings.get('index') is None or int(settings.get('count') or 1) <= 1:
+            return None
+        return int(settings['index']), int(settings['count'])
+    
+    @staticmethod
+    def shard_of(faculty_name: str, count: int) -> int:
+        """1-based shard a faculty member belongs to; stable across hosts, runs and roster order"""
+        key = FacultyNameMatcher.normalize(' '.join(faculty_name.split()))
+        return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'big') % count + 1
+    
+    def in_shard(self, faculty_list: List[str]) -> List[str]:
+        shard = self.shard()
+        if shard is None:
+            return list(faculty_list)
+        index, count = shard
+        return [name for name in faculty_list if self.shard_of(name, count) == index]
+    
+    def shard_suffix(self) -> str:
+        """Filename suffix keeping shard outputs apart, e.g. '_shard2of4' ('' outside shard mode)"""
+        shard = self.shard()
+        return f"_shard{shard[0]}of{shard[1]}" if shard else ''
+    
+    def load_faculty_roster(self) -> List[str]:
+        """Load the roster from the website (or its local cache), else the fallback list"""
         if self.config['faculty']['auto_fetch_from_website']:
             try:
                 print("🌐 Fetching faculty list from CSRR website...")
@@ -138,14 +2146,78 @@ class EnhancedFacultyMediaTracker:
         print(f"📋 Using fallback faculty list: {len(fallback_list)} members")
         return fallback_list
     
+    def read_roster_cache(self) -> Optional[Dict]:
+        path = self.config['faculty'].get('roster_cache')
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def write_roster_cache(self, entry: Dict):
+        path = self.config['faculty'].get('roster_cache')
+        if not path:
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+    
     def scrape_faculty_from_website(self) -> List[str]:
-        """Scrape faculty names from CSRR website"""
+        """Scrape faculty names from CSRR website, revalidating the local roster cache"""
         url = 'https://csrr.rutgers.edu/about/faculty-affiliates/'
-        response = self.session.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        cached = self.read_roster_cache()
+        if cached and cached.get('url') != url:
+            cached = None
+        
+        if cached:
+            max_age = float(self.config['faculty'].get('roster_cache_max_age_hours', 24)) * 3600
+            if time.time() - cached.get('fetched_at', 0) < max_age:
+                print("📋 Using cached faculty roster")
+                return cached['names']
+        
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(url, headers=headers, timeout=15)
+        if response.status_code == 304 and cached:
+            print("📋 Faculty roster unchanged since last fetch")
+            cached['fetched_at'] = time.time()
+            self.write_roster_cache(cached)
+            return cached['names']
+        response.raise_for_status()
+        
+        faculty_names = self.parse_faculty_page(response.content)
+        if faculty_names:
+            self.write_roster_cache({
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': time.time(),
+                'names': faculty_names
+            })
+        return faculty_names
+    
+    def use_lxml(self) -> bool:
+        """Whether HTML should be parsed with lxml rather than html.parser"""
+        return self.config['search'].get('html_parser', 'lxml') == 'lxml' and optional_import('lxml.html') is not None
+    
+    def parse_faculty_page(self, content: bytes) -> List[str]:
+        """Extract faculty names from the faculty affiliates page HTML"""
+        if self.use_lxml():
+            tree = optional_import('lxml.html').fromstring(content)
+            text_content = tree.text_content()
+            heading_texts = [el.text_content() for el in tree.xpath('//h3 | //h4 | //h5 | //strong | //b')]
+        else:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(content, 'html.parser')
+            text_content = soup.get_text()
+            heading_texts = [el.get_text() for el in soup.find_all(['h3', 'h4', 'h5', 'strong', 'b'])]
         
         faculty_names = []
-        text_content = soup.get_text()
         lines = text_content.split('\n')
         
         for i, line in enumerate(lines):
@@ -167,8 +2239,8 @@ class EnhancedFacultyMediaTracker:
                 if len(name.split()) >= 2 and len(name) < 50:
                     faculty_names.append(name)
         
-        for element in soup.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
-            text = element.get_text().strip()
+        for text in heading_texts:
+            text = text.strip()
             if text and len(text.split()) >= 2 and len(text) < 50:
                 words = text.split()
                 if all(word[0].isupper() for word in words if word):
@@ -185,301 +2257,252 @@ class EnhancedFacultyMediaTracker:
         
         return filtered_faculty
     
-    def search_google_api(self, query: str, faculty_name: str) -> List[Dict]:
+    def parse_bing_results(self, content: bytes) -> List[Tuple[str, str, str]]:
+        """Extract (title, url, snippet) from a Bing results page"""
+        return BingHTMLBackend.parse(content, self.config['search']['max_results_per_query'], self.use_lxml())
+    
+    def search_google_api(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
         """Search using Google Custom Search API"""
-        if not self.google_api_key or not self.google_cse_id:
-            return []
-        
-        try:
-            # Add date range to query
-            start_date = self.config['search_period']['start_date']
-            end_date = self.config['search_period']['end_date']
-            date_query = f"{query} after:{start_date} before:{end_date}"
-            
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                'key': self.google_api_key,
-                'cx': self.google_cse_id,
-                'q': date_query,
-                'num': min(self.config['search']['max_results_per_query'], 10),  # Google API max is 10
-                'dateRestrict': 'm1'  # Restrict to last month
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            results = []
-            
-            if 'items' in data:
-                for item in data['items']:
-                    title = item.get('title', '')
-                    link = item.get('link', '')
-                    snippet = item.get('snippet', '')
-                    
-                    # Validate faculty mention
-                    if not self.validate_faculty_mention(faculty_name, title, snippet):
-                        continue
-                    
-                    # Filter out irrelevant sources
-                    if not self.is_relevant_source(link, title, snippet):
-                        continue
-                    
-                    # Extract source and date
-                    source = self.extract_source(link)
-                    pub_date = self.extract_date(f"{title} {snippet}", link)
-                    
-                    # Filter out articles with unknown dates
-                    if pub_date == "Unknown":
-                        continue
-                    
-                    results.append({
-                        'faculty_name': faculty_name,
-                        'title': title,
-                        'url': link,
-                        'snippet': snippet,
-                        'source': source,
-                        'publication_date': pub_date,
-                        'search_method': 'Google API'
-                    })
-            
-            return results
-            
-        except Exception as e:
-            print(f"  ⚠️  Google API search error: {e}")
-            return []
+        return self.backend('google_api').search(query, faculty_names)
     
-    def search_basic_web(self, query: str, faculty_name: str) -> List[Dict]:
+    def search_basic_web(self, query: str, faculty_names: List[str]) -> List[MediaHit]:
         """Basic web search using Bing (fallback)"""
-        try:
-            start_date = self.config['search_period']['start_date']
-            end_date = self.config['search_period']['end_date']
-            date_query = f"{query} after:{start_date} before:{end_date}"
-            
-            url = f"https://www.bing.com/search?q={urllib.parse.quote(date_query)}&count={self.config['search']['max_results_per_query']}"
-            
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            results = []
-            
-            for result in soup.find_all('li', class_='b_algo')[:self.config['search']['max_results_per_query']]:
-                title_elem = result.find('h2')
-                if not title_elem:
-                    continue
-                    
-                title_link = title_elem.find('a')
-                if not title_link:
-                    continue
-                
-                title = title_link.get_text(strip=True)
-                link = title_link.get('href', '')
-                
-                snippet_elem = result.find('p')
-                snippet = snippet_elem.get_text(strip=True) if snippet_elem else ''
-                
-                if not self.validate_faculty_mention(faculty_name, title, snippet):
-                    continue
-                
-                # Filter out irrelevant sources
-                if not self.is_relevant_source(link, title, snippet):
-                    continue
-                
-                source = self.extract_source(link)
-                pub_date = self.extract_date(f"{title} {snippet}", link)
-                
-                # Filter out articles with unknown dates
-                if pub_date == "Unknown":
-                    continue
-                
-                results.append({
-                    'faculty_name': faculty_name,
-                    'title': title,
-                    'url': link,
-                    'snippet': snippet,
-                    'source': source,
-                    'publication_date': pub_date,
-                    'search_method': 'Basic Web'
-                })
-            
-            return results
-            
-        except Exception as e:
-            print(f"  ⚠️  Basic web search error: {e}")
-            return []
+        return self.backend('basic_web').search(query, faculty_names)
     
-    def search_faculty_media(self, faculty_name: str) -> List[Dict]:
-        """Comprehensive search for faculty media appearances"""
-        print(f"🔍 Searching for: {faculty_name}")
+    def build_results(self, payload, faculty_names: List[str], search_method: str,
+                      kind: str = 'candidates') -> List[MediaHit]:
+        """Filter (title, url, snippet) candidates, or a raw 'bing_html' page, into result records"""
+        kept, pub_dates = self.screen_candidates(payload, faculty_names, search_method, kind)
+        return self.dated_results(kept, search_method, pub_dates)
+    
+    def screen_candidates(self, payload, faculty_names: List[str], search_method: str,
+                          kind: str = 'candidates') -> Tuple[List[Tuple[str, str, str, List[str]]], Optional[List[Optional[date]]]]:
+        """Parse (for 'bing_html') and filter a response; snippet dates come back too if a worker process did it"""
+        pool = self.get_parse_pool()
+        if pool is None:
+            candidates = self.parse_bing_results(payload) if kind == 'bing_html' else payload
+            return self.filter_candidates(candidates, faculty_names, search_method), None
         
-        # Enhanced search queries focused on op-eds, print interviews, and television interviews
-        search_queries = []
+        with self.metrics.timer('parse_worker', search_method=search_method):
+            kept, pub_dates, candidates, mentioned = pool.submit(screen_in_worker, kind, payload, faculty_names).result()
+        self.metrics.increment('candidates', candidates, search_method=search_method)
+        self.metrics.increment('filter_rejected', candidates - mentioned, filter='faculty_mention')
+        self.metrics.increment('filter_rejected', mentioned - len(kept), filter='relevant_source')
+        return kept, pub_dates
+    
+    def parse_article_head(self, content: bytes) -> Dict:
+        """ArticleEnricher.parse_head, in a worker process if search.parse_workers is set"""
+        pool = self.get_parse_pool()
+        if pool is None:
+            return ArticleEnricher.parse_head(content, self.use_lxml())
+        return pool.submit(parse_head_in_worker, content).result()
+    
+    def get_parse_pool(self):
+        """Worker processes for parse + filter, started on first use in a run (None if disabled)"""
+        workers = int(self.config['search'].get('parse_workers', 0) or 0)
+        if workers <= 0:
+            return None
+        import multiprocessing  # Costs start-up time when unused
+        from concurrent.futures import ProcessPoolExecutor
+        with self.parse_pool_lock:
+            if self.parse_pool is None:
+                # Workers copy the roster and the search period as they are now; close_parse_pool()
+                # at the end of the run so the next run starts workers with its own settings.
+                # Spawned, not forked: the pool starts from a search thread while the transport,
+                # backend and enrichment threads are running, and a forked child can deadlock
+                self.parse_pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=init_parse_worker, initargs=(self.name_matcher.faculty_names, self.config)
+                )
+            return self.parse_pool
+    
+    def close_parse_pool(self):
+        with self.parse_pool_lock:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+    
+    def filter_candidates(self, candidates: List[Tuple[str, str, str]], faculty_names: List[str],
+                          search_method: str) -> List[Tuple[str, str, str, List[str]]]:
+        """Keep candidates that name a faculty member and come from a relevant source"""
+        metrics = self.metrics
+        metrics.increment('candidates', len(candidates), search_method=search_method)
         
-        # Op-eds and opinion pieces
-        search_queries.extend([
-            f'"{faculty_name}" op-ed',
-            f'"{faculty_name}" opinion piece',
-            f'"{faculty_name}" editorial',
-            f'"{faculty_name}" opinion',
-            f'"{faculty_name}" guest column',
-            f'"{faculty_name}" commentary'
-        ])
+        # Validate faculty mention (attributing packed queries to whoever is named) and filter out irrelevant sources
+        with metrics.timer('filter', filter='faculty_mention'):
+            mentioned = []
+            for title, link, snippet in candidates:
+                names = [name for name in faculty_names if self.validate_faculty_mention(name, title, snippet)]
+                if names:
+                    mentioned.append((title, link, snippet, names))
+        with metrics.timer('filter', filter='relevant_source'):
+            kept = [c for c in mentioned if self.is_relevant_source(c[1], c[0], c[2])]
         
-        # Print interviews
-        search_queries.extend([
-            f'"{faculty_name}" interview',
-            f'"{faculty_name}" interviewed',
-            f'"{faculty_name}" speaks with',
-            f'"{faculty_name}" Q&A',
-            f'"{faculty_name}" conversation with'
-        ])
+        metrics.increment('filter_rejected', len(candidates) - len(mentioned), filter='faculty_mention')
+        metrics.increment('filter_rejected', len(mentioned) - len(kept), filter='relevant_source')
+        return kept
+    
+    def dated_results(self, kept: List[Tuple[str, str, str, List[str]]], search_method: str,
+                      pub_dates: Optional[List[Optional[date]]] = None) -> List[MediaHit]:
+        """Date filtered candidates and build one result record per attributed faculty member"""
+        # Extract dates for the whole batch in one pass (unless a parse worker already did)
+        if pub_dates is None:
+            with self.metrics.timer('filter', filter='date'):
+                pub_dates = self.date_extractor.extract_many([f"{c[0]} {c[2]}" for c in kept])
         
-        # Television interviews
-        search_queries.extend([
-            f'"{faculty_name}" television',
-            f'"{faculty_name}" TV interview',
-            f'"{faculty_name}" news interview',
-            f'"{faculty_name}" CNN',
-            f'"{faculty_name}" MSNBC',
-            f'"{faculty_name}" Fox News',
-            f'"{faculty_name}" PBS',
-            f'"{faculty_name}" ABC',
-            f'"{faculty_name}" CBS',
-            f'"{faculty_name}" NBC'
-        ])
+        metadata = {}
+        settings = self.config['enrichment']
+        if settings.get('enabled'):
+            undated_only = settings.get('undated_only', False)
+            metadata = self.enricher.enrich([c[1] for c, d in zip(kept, pub_dates) if d is None or not undated_only])
         
-        all_results = []
+        results = []
+        rejected = 0
+        for (title, link, snippet, names), pub_date in zip(kept, pub_dates):
+            meta = metadata.get(link) or {}
+            published = DateExtractor.parse_timestamp(meta['published']) if meta.get('published') else None
+            if published is not None:
+                # The page's own metadata beats a date mined from the snippet
+                pub_date = published if self.date_extractor.in_range(published) else None
+            
+            # Filter out articles with unknown dates
+            if pub_date is None:
+                rejected += 1
+                continue
+            
+            source = self.extract_source(link)
+            for faculty_name in names:
+                results.append(MediaHit(
+                    faculty_name, title, link, snippet, source, pub_date, search_method, meta.get('author') or ''
+                ))
+        self.metrics.increment('filter_rejected', rejected, filter='date')
+        return results
+    
+    def search_faculty_media(self, faculty_name: str) -> List[MediaHit]:
+        """Comprehensive search for faculty media appearances"""
+        return self.search_faculty_group([faculty_name])[0][faculty_name]
+    
+    def search_faculty_group(self, faculty_names: List[str]) -> Tuple[Dict[str, List[MediaHit]], bool]:
+        """Search one or more faculty with packed OR queries
+
+        Returns results per faculty and whether every planned query ran; a group cut short
+        by the request budget, a daily quota, a latency budget or an error is incomplete.
+        """
+        print(f"🔍 Searching for: {', '.join(faculty_names)}")
         
-        # Use Google API if available
-        if self.config['search']['use_google_api'] and self.google_api_key:
-            for query in search_queries[:3]:  # Limit to top 3 queries to avoid rate limits
-                try:
-                    results = self.search_google_api(query, faculty_name)
-                    all_results.extend(results)
-                    time.sleep(random.uniform(2, 3))  # Increased API rate limiting
-                except Exception as e:
-                    if "429" in str(e):
-                        print(f"  ⚠️  Rate limit hit, waiting 10 seconds...")
-                        time.sleep(10)  # Wait longer on rate limit
-                    else:
-                        print(f"  ⚠️  Google API query error: {e}")
-                    continue
+        backends = [backend for backend in self.backends if backend.enabled()]
+        all_results = []
+        complete = True
         
-        # Use basic search as fallback or supplement
-        if self.config['search']['use_basic_search']:
-            for query in search_queries[:3]:  # Limit basic search queries
+        if len(backends) == 1:
+            results, complete = self.run_backend(backends[0], faculty_names, self.backend_deadline(backends[0]))
+            all_results.extend(results)
+        elif backends:
+            # Fan out to every backend at once; results are merged in backend order so reports stay stable
+            pool = self.get_backend_pool()
+            deadlines = [self.backend_deadline(backend) for backend in backends]
+            futures = [pool.submit(self.run_backend, backend, faculty_names, deadline)
+                       for backend, deadline in zip(backends, deadlines)]
+            # Workers stop at their deadline on their own; the grace covers one request still in flight
+            grace = float(self.config['transport'].get('timeout', 15) or 15)
+            for backend, deadline, future in zip(backends, deadlines, futures):
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic()) + grace
                 try:
-                    results = self.search_basic_web(query, faculty_name)
+                    results, backend_complete = future.result(timeout=timeout)
                     all_results.extend(results)
-                    time.sleep(random.uniform(1, self.config['search']['delay_between_searches']))
+                    complete = complete and backend_complete
+                except FuturesTimeoutError:
+                    complete = False
+                    self.metrics.increment('backend_timeouts', backend=backend.name)
+                    print(f"  ⏱️  {backend.name} exceeded its latency budget, skipping its results")
                 except Exception as e:
-                    print(f"  ⚠️  Basic search error: {e}")
-                    continue
+                    complete = False
+                    print(f"  ⚠️  {backend.name} backend error: {e}")
         
-        # Remove duplicates and limit results
-        unique_results = []
-        seen_urls = set()
+        # Remove duplicates (same canonical URL or a syndicated copy) and limit results per faculty
+        grouped = {name: [] for name in faculty_names}
+        indexes = {name: self.create_duplicate_index() for name in faculty_names}
+        max_results = self.config['output']['max_results_per_faculty']
         
         for result in all_results:
-            url = result.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(result)
-                
-                if len(unique_results) >= self.config['output']['max_results_per_faculty']:
-                    break
+            faculty_name = result.faculty_name
+            if not result.url or len(grouped[faculty_name]) >= max_results:
+                continue
+            if indexes[faculty_name].add(result) is None:
+                grouped[faculty_name].append(result)
+            else:
+                self.metrics.increment('duplicates_dropped')
         
-        if unique_results:
-            print(f"  ✅ Found {len(unique_results)} articles")
+        found = sum(len(results) for results in grouped.values())
+        if found:
+            print(f"  ✅ Found {found} articles")
         else:
             print(f"  ❌ No articles found")
         
-        return unique_results
+        return grouped, complete
+    
+    def backend_deadline(self, backend: SearchBackend) -> Optional[float]:
+        """time.monotonic() by which the backend must finish this group, or None"""
+        budget = backend.latency_budget()
+        return time.monotonic() + budget if budget > 0 else None
+    
+    def get_backend_pool(self) -> ThreadPoolExecutor:
+        """Shared pool for backend fan-out, sized for every faculty worker at once"""
+        with self.backend_pool_lock:
+            if self.backend_pool is None:
+                workers = max(1, int(self.config['search'].get('max_workers', 1) or 1))
+                self.backend_pool = ThreadPoolExecutor(
+                    max_workers=workers * len(self.backends), thread_name_prefix='backend'
+                )
+            return self.backend_pool
+    
+    def run_backend(self, backend: SearchBackend, faculty_names: List[str],
+                    deadline: Optional[float]) -> Tuple[List[MediaHit], bool]:
+        """Run a backend's planned queries for one group, stopping early past the deadline
+
+        Returns the results and whether every planned query ran to completion.
+        """
+        results = []
+        complete = True
+        # rate_limited_get reads the deadline here, so time queued behind the rate limiter counts too
+        self.search_context.deadline = deadline
+        try:
+            for planned in self.query_planners[backend.name].plan(faculty_names):
+                if deadline is not None and time.monotonic() > deadline:
+                    self.metrics.increment('backend_budget_exceeded', backend=backend.name)
+                    print(f"  ⏱️  {backend.name} over its latency budget, skipping remaining queries")
+                    complete = False
+                    break
+                try:
+                    with self.metrics.timer('search', backend=backend.name):
+                        results.extend(backend.search(planned.query, planned.faculty_names))
+                    continue
+                except PartialResults as e:
+                    # Pages fetched before the error are kept
+                    results.extend(e.results)
+                    error = e.__cause__
+                except Exception as e:
+                    error = e
+                
+                complete = False
+                if isinstance(error, DeadlineExceeded):
+                    self.metrics.increment('backend_budget_exceeded', backend=backend.name)
+                    print(f"  ⏱️  {backend.name} would queue past its latency budget, skipping remaining queries")
+                    break
+                if isinstance(error, BudgetExhausted):
+                    break  # Later queries would be refused too; keep what earlier queries returned
+                print(f"  ⚠️  {backend.name} query error: {error}")
+        finally:
+            self.search_context.deadline = None
+        return results, complete
     
     def is_relevant_source(self, url: str, title: str, snippet: str) -> bool:
         """Strict filtering for ONLY op-eds, print interviews, and television interviews"""
-        url_lower = url.lower()
-        title_lower = title.lower()
-        snippet_lower = snippet.lower()
-        content_lower = f"{title_lower} {snippet_lower}"
-        
-        # STRICT: Must be from legitimate news/media sources
-        legitimate_domains = [
-            'nytimes.com', 'washingtonpost.com', 'wsj.com', 'usatoday.com', 'latimes.com',
-            'chicagotribune.com', 'bostonglobe.com', 'philly.com', 'miamiherald.com',
-            'cnn.com', 'msnbc.com', 'foxnews.com', 'abcnews.go.com', 'cbsnews.com', 'nbcnews.com',
-            'pbs.org', 'npr.org', 'bbc.com', 'reuters.com', 'ap.org', 'bloomberg.com',
-            'politico.com', 'thehill.com', 'rollcall.com', 'nationalreview.com', 'newyorker.com',
-            'atlantic.com', 'huffpost.com', 'vox.com', 'slate.com', 'salon.com',
-            'guardian.com', 'independent.co.uk', 'telegraph.co.uk', 'ft.com', 'economist.com',
-            'aljazeera.com', 'middleeasteye.net', 'newarab.com', 'arabnews.com',
-            'law.com', 'abajournal.com', 'law360.com', 'scotusblog.com', 'justsecurity.org',
-            'lawfaremedia.org', 'balkinization.net', 'volokh.com', 'concurringopinions.com'
-        ]
-        
-        # Check if URL contains any legitimate domain
-        is_legitimate_source = any(domain in url_lower for domain in legitimate_domains)
-        if not is_legitimate_source:
-            return False
-        
-        # STRICT: Must contain specific media content indicators
-        media_indicators = [
-            'op-ed', 'opinion', 'editorial', 'guest column', 'commentary',
-            'interview', 'interviewed', 'speaks with', 'conversation with', 'q&a',
-            'television', 'tv interview', 'news interview', 'appears on', 'discusses',
-            'writes', 'author', 'byline', 'contributed', 'analysis'
-        ]
-        
-        has_media_indicator = any(indicator in content_lower for indicator in media_indicators)
-        if not has_media_indicator:
-            return False
-        
-        # EXCLUDE: Social media, academic papers, irrelevant content
-        exclude_patterns = [
-            'facebook.com', 'instagram.com', 'tiktok.com', 'twitter.com', 'x.com',
-            'linkedin.com', 'reddit.com', 'youtube.com', 'researchgate.net', 'jstor.org',
-            'academia.edu', 'scholar.google.com', 'arxiv.org', 'ssrn.com',
-            'archive', 'archives', 'course', 'syllabus', 'academic', 'student',
-            'sale', 'shop', 'store', 'product', 'booking', 'hotel', 'travel',
-            'obituary', 'funeral', 'memorial', 'wedding', 'birthday', 'party'
-        ]
-        
-        for pattern in exclude_patterns:
-            if pattern in url_lower or pattern in content_lower:
-                return False
-        
-        return True
+        return self.source_filter.is_relevant(url, title, snippet)
     
     def validate_faculty_mention(self, faculty_name: str, title: str, snippet: str) -> bool:
         """Validate that the faculty member is actually mentioned"""
-        content_text = f"{title} {snippet}".lower()
-        faculty_lower = faculty_name.lower()
-        
-        # Check for exact name match
-        if faculty_lower in content_text:
-            return True
-        
-        # Check for name components
-        name_parts = faculty_lower.split()
-        if len(name_parts) >= 2:
-            last_name = name_parts[-1]
-            first_name = name_parts[0]
-            
-            if last_name in content_text and first_name in content_text:
-                title_words = title.lower().split()
-                snippet_words = snippet.lower().split()
-                all_words = title_words + snippet_words
-                
-                try:
-                    first_pos = all_words.index(first_name)
-                    last_pos = all_words.index(last_name)
-                    if abs(first_pos - last_pos) <= 5:
-                        return True
-                except ValueError:
-                    pass
-        
-        return False
+        return self.name_matcher.matches(faculty_name, f"{title} {snippet}")
     
     def extract_source(self, url: str) -> str:
         """Extract source name from URL"""
@@ -491,82 +2514,138 @@ class EnhancedFacultyMediaTracker:
             return "Unknown"
     
     def extract_date(self, content: str, url: str) -> str:
-        """Extract publication date with strict validation for June 1 - Aug 19, 2025"""
-        # Only look for dates in 2025, specifically June-August
-        date_patterns = [
-            r'(Jun|Jul|Aug)[a-z]*\.?\s+\d{1,2},?\s+2025',
-            r'\d{1,2}[/-](06|07|08)[/-]2025',
-            r'2025-(06|07|08)-\d{2}',
-            r'(June|July|August)\s+\d{1,2},?\s+2025'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                date_str = match.group(0)
-                # Additional validation - must be June 1 or later, Aug 19 or earlier
-                if self.is_valid_date_in_range(date_str):
-                    return date_str
-        
+        """Extract a publication date within the configured search period"""
+        pub_date = self.date_extractor.extract(content)
         # If no valid date found, return "Unknown" instead of generic "2025"
-        return "Unknown"
+        return DateExtractor.format(pub_date) if pub_date else "Unknown"
+    
+    def parse_publication_date(self, date_str: str) -> Optional[datetime]:
+        """Parse a date string as produced by extract_date"""
+        date_str_clean = str(date_str).strip()
+        for fmt in ['%b %d, %Y', '%B %d, %Y', '%m/%d/%Y', '%Y-%m-%d']:
+            try:
+                return datetime.strptime(date_str_clean, fmt)
+            except ValueError:
+                continue
+        return None
     
     def is_valid_date_in_range(self, date_str: str) -> bool:
-        """Validate that date is within June 1 - August 19, 2025"""
-        try:
-            # Parse the date string
-            date_str_clean = date_str.strip()
-            
-            # Try different formats
-            for fmt in ['%b %d, %Y', '%B %d, %Y', '%m/%d/%Y', '%Y-%m-%d']:
-                try:
-                    parsed_date = datetime.strptime(date_str_clean, fmt)
-                    
-                    # Check if it's in our range: June 1 - August 19, 2025
-                    start_date = datetime(2025, 6, 1)
-                    end_date = datetime(2025, 8, 19)
-                    
-                    if start_date <= parsed_date <= end_date:
-                        return True
-                    else:
-                        return False
-                        
-                except ValueError:
-                    continue
-            
-            return False
-        except:
-            return False
+        """Validate that date is within the configured search period"""
+        parsed_date = self.parse_publication_date(date_str)
+        return parsed_date is not None and self.date_extractor.in_range(parsed_date.date())
     
-    def create_excel_report(self, results: List[Dict]) -> str:
-        """Create Excel report"""
-        if not results:
-            df = pd.DataFrame(columns=[
-                "Faculty Name", "Title", "Source", "URL", 
-                "Publication Date", "Date Found", "Snippet", "Search Method"
-            ])
-        else:
-            excel_data = []
-            for result in results:
-                excel_data.append({
-                    "Faculty Name": result['faculty_name'],
-                    "Title": result['title'],
-                    "Source": result['source'],
-                    "URL": result['url'],
-                    "Publication Date": result['publication_date'],
-                    "Date Found": datetime.now().strftime('%Y-%m-%d'),
-                    "Snippet": result['snippet'][:500] + "..." if len(result['snippet']) > 500 else result['snippet'],
-                    "Search Method": result.get('search_method', 'Unknown')
-                })
-            df = pd.DataFrame(excel_data)
+    def report_rows(self, results: Iterable[MediaHit]) -> Iterator[Tuple]:
+        """One REPORT_COLUMNS row per result, produced lazily"""
+        date_found = datetime.now().strftime('%Y-%m-%d')
+        for result in results:
+            snippet = result.snippet
+            yield (
+                '; '.join(result.faculty_names),
+                result.title,
+                result.source,
+                result.author,
+                result.url,
+                result.publication_date,
+                date_found,
+                snippet[:500] + "..." if len(snippet) > 500 else snippet,
+                result.search_method
+            )
+    
+    def report_info(self, report_period: Optional[Dict] = None) -> Dict[str, str]:
+        """Covered period, stored with every report and read back by --incremental"""
+        report_period = report_period or self.config['search_period']
+        info = {
+            "Start Date": report_period['start_date'],
+            "End Date": report_period['end_date'],
+            "Generated": datetime.now().strftime('%Y-%m-%d %H:%M')
+        }
+        shard = self.shard()
+        if shard is not None:
+            info["Shard"] = f"{shard[0]}/{shard[1]}"  # Checked by --merge
+        return info
+    
+    def report_filename(self, extension: str, report_period: Optional[Dict] = None) -> str:
+        """Excel-derived report filename with the given extension, suffixed with the period name and shard"""
+        stem = os.path.splitext(self.config['output']['excel_filename'])[0]
+        if report_period is not None:
+            stem = f"{stem}_{report_period['name']}"
+        return stem + self.shard_suffix() + extension
+    
+    def create_excel_report(self, results: Iterable[MediaHit], report_period: Optional[Dict] = None) -> str:
+        """Create Excel report, streaming rows so memory stays flat for any number of results"""
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        workbook = openpyxl.Workbook(write_only=True)
+        bold = Font(bold=True)
+        
+        def header(sheet, columns):
+            cells = []
+            for column in columns:
+                cell = WriteOnlyCell(sheet, value=column)
+                cell.font = bold
+                cells.append(cell)
+            sheet.append(cells)
+        
+        sheet = workbook.create_sheet("Sheet1")
+        header(sheet, self.REPORT_COLUMNS)
+        for row in self.report_rows(results):
+            sheet.append(row)
+        
+        # Read back by --incremental to find the period already covered
+        info = self.report_info(report_period)
+        info_sheet = workbook.create_sheet("Report Info")
+        header(info_sheet, list(info))
+        info_sheet.append(list(info.values()))
         
         filename = self.config['output']['excel_filename']
-        df.to_excel(filename, index=False)
+        if report_period is not None or self.shard() is not None:
+            filename = self.report_filename(os.path.splitext(filename)[1] or '.xlsx', report_period)
+        workbook.save(filename)
         print(f"📊 Excel report saved: {filename}")
         return filename
     
-    def create_word_report(self, results: List[Dict]) -> str:
-        """Create Word report with clean, professional formatting"""
+    def create_csv_report(self, results: Iterable[MediaHit], report_period: Optional[Dict] = None) -> str:
+        """Write the Excel report's rows as UTF-8 CSV (opens in Excel with the BOM)"""
+        filename = self.report_filename('.csv', report_period)
+        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.REPORT_COLUMNS)
+            writer.writerows(self.report_rows(results))
+        print(f"📊 CSV report saved: {filename}")
+        return filename
+    
+    def create_parquet_report(self, results: Iterable[MediaHit], report_period: Optional[Dict] = None,
+                              batch_size: int = 5000) -> Optional[str]:
+        """Write the report rows to Parquet in row groups of batch_size (requires pyarrow)"""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            print("⚠️  pyarrow not installed, skipping Parquet report")
+            return None
+        
+        filename = self.report_filename('.parquet', report_period)
+        columns = [column.lower().replace(' ', '_') for column in self.REPORT_COLUMNS]
+        schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        metadata = {key.lower().replace(' ', '_'): value for key, value in self.report_info(report_period).items()}
+        schema = schema.with_metadata(metadata)
+        
+        with pyarrow.parquet.ParquetWriter(filename, schema) as writer:
+            batch = []
+            for row in self.report_rows(results):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    writer.write_table(pyarrow.Table.from_pylist([dict(zip(columns, r)) for r in batch], schema))
+                    batch = []
+            if batch:
+                writer.write_table(pyarrow.Table.from_pylist([dict(zip(columns, r)) for r in batch], schema))
+        print(f"📊 Parquet report saved: {filename}")
+        return filename
+    
+    def create_word_report(self, faculty_results: Dict[str, List[MediaHit]], report_period: Optional[Dict] = None) -> str:
+        """Create Word report with clean, professional formatting from results grouped by faculty"""
+        from docx import Document
         doc = Document()
         
         # Set document properties
@@ -577,8 +2656,8 @@ class EnhancedFacultyMediaTracker:
         title_para = doc.add_heading("CSRR Faculty Op-Eds, Print Interviews, and Television Interviews", 0)
         
         # Subtitle with date range
-        start_date = self.config['search_period']['start_date']
-        end_date = self.config['search_period']['end_date']
+        start_date = (report_period or self.config['search_period'])['start_date']
+        end_date = (report_period or self.config['search_period'])['end_date']
         
         from datetime import datetime
         try:
@@ -591,14 +2670,6 @@ class EnhancedFacultyMediaTracker:
         subtitle_para = doc.add_paragraph(period)
         doc.add_paragraph("")
         
-        # Group results by faculty
-        faculty_results = {}
-        for result in results:
-            faculty = result['faculty_name']
-            if faculty not in faculty_results:
-                faculty_results[faculty] = []
-            faculty_results[faculty].append(result)
-        
         # Add results by faculty
         for faculty_name in sorted(faculty_results.keys()):
             # Add faculty name as a paragraph
@@ -608,17 +2679,20 @@ class EnhancedFacultyMediaTracker:
             results = faculty_results[faculty_name]
             for result in results:
                 # Clean up the title (remove extra spaces and truncate if too long)
-                title = result['title'].strip()
+                title = result.title.strip()
                 if len(title) > 100:
                     title = title[:97] + "..."
                 
                 # Format the entry cleanly
+                coauthors = [name for name in result.faculty_names if name != faculty_name]
                 formatted_entry = (
                     f"{title}, "
-                    f"{result['source']}, "
-                    f"{result['publication_date']}, "
-                    f"{result['url']}."
+                    f"{result.source}, "
+                    f"{result.publication_date}, "
+                    f"{result.url}."
                 )
+                if coauthors:
+                    formatted_entry += f" (with {', '.join(coauthors)})"
                 doc.add_paragraph(formatted_entry)
             
             # Add space between faculty
@@ -633,9 +2707,6 @@ class EnhancedFacultyMediaTracker:
             doc.add_paragraph(faculty_name)
         
         # Create filename with date range
-        start_date = self.config['search_period']['start_date']
-        end_date = self.config['search_period']['end_date']
-        
         from datetime import datetime
         try:
             start_dt = datetime.strptime(start_date, '%Y-%m-%d')
@@ -648,7 +2719,9 @@ class EnhancedFacultyMediaTracker:
         except:
             date_suffix = f"{start_date.replace('-', '')}_to_{end_date.replace('-', '')}"
         
-        filename = f"CSRR_Faculty_Op-Eds_{date_suffix}.docx"
+        if report_period is not None:
+            date_suffix = report_period['name']  # Month-based suffixes can collide between periods
+        filename = f"CSRR_Faculty_Op-Eds_{date_suffix}{self.shard_suffix()}.docx"
         
         # Save to Downloads folder if configured
         if self.config['output']['save_to_downloads']:
@@ -659,7 +2732,198 @@ class EnhancedFacultyMediaTracker:
         print(f"📄 Word report saved: {filename}")
         return filename
     
-    def run_search(self) -> Dict[str, str]:
+    def search_and_checkpoint(self, faculty_names: List[str]) -> Dict[str, List[MediaHit]]:
+        """Search a faculty group and journal each member's results as soon as they complete
+
+        Groups whose search was cut short are left out of the journal, so --resume searches them again.
+        """
+        grouped, complete = self.search_faculty_group(faculty_names)
+        if self.journal is not None:
+            if complete:
+                for faculty_name in faculty_names:
+                    self.journal.record(faculty_name, grouped[faculty_name])
+            else:
+                self.metrics.increment('groups_incomplete')
+                print(f"  ↩️  Search incomplete, not checkpointing: {', '.join(faculty_names)}")
+        return grouped
+    
+    def load_previous_report(self, excel_file: str) -> Tuple[List[MediaHit], Optional[Dict]]:
+        """Read results (and the covered period, if recorded) from an earlier Excel report"""
+        import openpyxl
+        workbook = openpyxl.load_workbook(excel_file, read_only=True)
+        try:
+            def records(sheet) -> Iterator[Dict[str, str]]:
+                rows = sheet.iter_rows(values_only=True)
+                columns = [str(c) if c is not None else '' for c in next(rows, ())]
+                for row in rows:
+                    yield {c: '' if v is None else str(v) for c, v in zip(columns, row)}
+            
+            results = []
+            for row in records(workbook.worksheets[0]):
+                # Co-authored articles list every faculty member, separated by '; '
+                faculty_names = [name.strip() for name in row.get('Faculty Name', '').split(';') if name.strip()]
+                pub_date = self.parse_publication_date(row.get('Publication Date', ''))
+                results.append(MediaHit(
+                    faculty_names[0] if faculty_names else '',
+                    row.get('Title', ''),
+                    row.get('URL', ''),
+                    row.get('Snippet', ''),
+                    row.get('Source', ''),
+                    pub_date.date() if pub_date else None,
+                    row.get('Search Method', '') or 'Unknown',
+                    row.get('Author', ''),
+                    faculty_names
+                ))
+            
+            period = None
+            if 'Report Info' in workbook.sheetnames:
+                info = next(records(workbook['Report Info']), None)
+                if info:
+                    period = {'start_date': info['Start Date'][:10], 'end_date': info['End Date'][:10]}
+                    if info.get('Shard'):
+                        period['shard'] = info['Shard']
+        finally:
+            workbook.close()
+        return results, period
+    
+    def plan_incremental_run(self, excel_file: str) -> Tuple[List[MediaHit], str]:
+        """Return previous results still in period and the first date that needs searching"""
+        start_date = self.config['search_period']['start_date']
+        end_date = self.config['search_period']['end_date']
+        previous_results, previous_period = self.load_previous_report(excel_file)
+        
+        if previous_period is None:
+            # Older reports lack the period sheet; assume coverage up to the newest article
+            dates = [r.published for r in previous_results if r.published is not None]
+            if not dates:
+                print("⚠️  Previous report has no period info or dated articles, searching full period")
+                return [], start_date
+            previous_period = {'start_date': min(dates).strftime('%Y-%m-%d'), 'end_date': max(dates).strftime('%Y-%m-%d')}
+        
+        if previous_period['start_date'] > start_date:
+            print("⚠️  Previous report starts after the configured period, searching full period")
+            return [], start_date
+        
+        search_start = max(
+            start_date,
+            (datetime.strptime(previous_period['end_date'], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        )
+        
+        # Keep only previous articles that still fall inside the configured period
+        period_start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        period_end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        kept = []
+        for result in previous_results:
+            if result.published is None or period_start <= result.published <= period_end:
+                kept.append(result)
+        
+        print(f"📎 Incremental run: reusing {len(kept)} articles from {excel_file}")
+        return kept, search_start
+    
+    def iter_faculty_results(self, faculty_list: List[str], completed: Dict[str, List[MediaHit]],
+                             searches: Iterator[Tuple[str, List[MediaHit]]]) -> Iterator[Tuple[str, List[MediaHit]]]:
+        """Search stage: (faculty_name, results) in roster order, replaying faculty finished before --resume"""
+        for faculty_name in faculty_list:
+            if faculty_name in completed:
+                yield faculty_name, completed[faculty_name]
+            else:
+                yield next(searches)
+    
+    def with_previous(self, stream: Iterator[Tuple[str, List[MediaHit]]], previous: List[MediaHit]) -> Iterator[Tuple[str, List[MediaHit]]]:
+        """Incremental stage: put each faculty member's results from the previous report ahead of the new ones"""
+        by_faculty = {}
+        for result in previous:
+            by_faculty.setdefault(result.faculty_name, []).append(result)
+        for faculty_name, results in stream:
+            yield faculty_name, by_faculty.pop(faculty_name, []) + results
+        # Faculty in the previous report who are no longer on the roster
+        for faculty_name, results in by_faculty.items():
+            yield faculty_name, results
+    
+    def dedup_stage(self, stream: Iterator[Tuple[str, List[MediaHit]]]) -> Iterator[Tuple[str, List[MediaHit], List[MediaHit]]]:
+        """Dedup stage: (faculty_name, new articles, earlier articles that gained this co-author)
+
+        One article gets one record across the whole run; a copy found for another faculty
+        member adds that name to the earlier record instead.
+        """
+        index = self.create_duplicate_index()
+        for faculty_name, results in stream:
+            new, updated = [], []
+            for result in results:
+                existing = index.add(result)
+                if existing is None:
+                    new.append(result)
+                    continue
+                for name in result.faculty_names:
+                    if name not in existing.faculty_names:
+                        existing.faculty_names.append(name)
+                        self.metrics.increment('coauthor_merges')
+                        if existing not in new and existing not in updated:
+                            updated.append(existing)
+            yield faculty_name, new, updated
+    
+    def create_sinks(self, run_id: int) -> List:
+        """Sinks fed by the pipeline as each faculty member finishes"""
+        sinks = [StoreSink(self.store, run_id)]
+        progress_csv = self.config['output'].get('progress_csv')
+        if progress_csv:
+            sinks.append(ProgressCsvSink(progress_csv, self.REPORT_COLUMNS, self.report_rows))
+        return sinks
+    
+    def iter_faculty_searches(self, faculty_list: List[str]) -> Iterator[Tuple[str, List[MediaHit]]]:
+        """Yield (faculty_name, results) in roster order, searching concurrently if configured"""
+        workers = max(1, int(self.config['search'].get('max_workers', 1) or 1))
+        group_size = max(1, int(self.config['query_planner'].get('faculty_per_query', 1) or 1))
+        groups = [faculty_list[i:i + group_size] for i in range(0, len(faculty_list), group_size)]
+        total = len(faculty_list)
+        
+        if workers == 1:
+            done = 0
+            for group in groups:
+                print(f"[{done + 1:3d}/{total}] ", end="")
+                grouped = self.search_and_checkpoint(group)
+                done += len(group)
+                for faculty_name in group:
+                    yield faculty_name, grouped[faculty_name]
+            return
+        
+        print(f"⚡ Concurrent mode: {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() returns results in submission order, keeping reports identical to a sequential run
+            i = 0
+            for group, grouped in zip(groups, executor.map(self.search_and_checkpoint, groups)):
+                for faculty_name in group:
+                    i += 1
+                    print(f"[{i:3d}/{total}] {faculty_name}: {len(grouped[faculty_name])} articles")
+                    yield faculty_name, grouped[faculty_name]
+    
+    def print_metrics_summary(self):
+        """Short console digest of where time and requests went"""
+        snapshot = self.metrics.snapshot()
+        print("\n⏱️  Stage timings:")
+        for timer in snapshot['timers']:
+            if timer['name'] == 'stage':
+                print(f"   {timer['labels']['stage']}: {timer['total_seconds']:.1f}s")
+        for backend in self.backends:
+            requests_sent = self.metrics.counter_total('http_requests', backend=backend.name)
+            if requests_sent:
+                print(f"   {backend.name}: {requests_sent:.0f} requests")
+            timeouts = self.metrics.counter_total('backend_timeouts', backend=backend.name)
+            if timeouts:
+                print(f"   {backend.name}: {timeouts:.0f} groups over latency budget")
+        print("🧹 Filter drops:")
+        for name in ('faculty_mention', 'relevant_source', 'date'):
+            print(f"   {name}: {self.metrics.counter_total('filter_rejected', filter=name):.0f}")
+    
+    def export_metrics(self):
+        """Write the Prometheus textfile (if configured) and close the JSON lines log"""
+        textfile = self.config['metrics'].get('prometheus_textfile')
+        if textfile:
+            self.metrics.write_prometheus(textfile)
+            print(f"📈 Metrics written: {textfile}")
+        self.metrics.close()
+    
+    def run_search(self, resume: bool = False, incremental_from: Optional[str] = None) -> Dict[str, str]:
         """Run the complete enhanced media search"""
         print("=" * 60)
         print("🎯 ENHANCED CSRR FACULTY MEDIA TRACKER")
@@ -672,32 +2936,101 @@ class EnhancedFacultyMediaTracker:
             print("⚠️  Google API not configured - Using basic search only")
             print("💡 For enhanced results, set GOOGLE_API_KEY and GOOGLE_CSE_ID")
         
+        periods = self.report_periods()
+        period = self.config['search_period']
+        report_start, report_end = period['start_date'], period['end_date']
+        max_results = self.config['output']['max_results_per_faculty']
+        if periods:
+            # One sweep over the union of all windows; results are bucketed into per-period reports
+            period['start_date'] = min(p['start_date'] for p in periods)
+            period['end_date'] = max(p['end_date'] for p in periods)
+            self.config['output']['max_results_per_faculty'] = max_results * len(periods)
+            print(f"🗓️  Multi-period mode: {len(periods)} reports from one search")
+            if incremental_from:
+                print("⚠️  --incremental is ignored in multi-period mode")
+                incremental_from = None
+        
         # Load faculty list
-        faculty_list = self.fetch_faculty_list()
+        run_start = time.perf_counter()
+        with self.metrics.timer('stage', stage='roster'):
+            faculty_list = self.fetch_faculty_list()
+        self.name_matcher = FacultyNameMatcher(faculty_list)
         print(f"👥 Processing {len(faculty_list)} faculty members")
+        if self.shard() is not None:
+            print(f"🧩 Shard {self.shard()[0]} of {self.shard()[1]}")
         print(f"📅 Period: {self.config['search_period']['start_date']} to {self.config['search_period']['end_date']}")
         print("=" * 60)
         print()
         
-        all_results = []
-        faculty_with_results = 0
+        previous_results = []
+        if incremental_from:
+            previous_results, period['start_date'] = self.plan_incremental_run(incremental_from)
+            print(f"📅 Searching new range only: {period['start_date']} to {period['end_date']}")
         
-        # Process each faculty member
-        for i, faculty_name in enumerate(faculty_list, 1):
-            print(f"[{i:3d}/{len(faculty_list)}] ", end="")
-            
-            results = self.search_faculty_media(faculty_name)
-            
-            if results:
-                faculty_with_results += 1
-                all_results.extend(results)
+        # Date filtering follows the period actually searched (union of periods, or the incremental range)
+        self.date_extractor = DateExtractor.from_config(self.config)
+        
+        # Journal every completed faculty so an interrupted run can --resume
+        checkpoint_path, extension = os.path.splitext(self.config['checkpoint']['path'])
+        self.journal = CheckpointJournal(
+            checkpoint_path + self.shard_suffix() + extension, period['start_date'], period['end_date']
+        )
+        if resume:
+            completed = self.journal.load()
+            if completed:
+                print(f"⏩ Resuming: {len(completed)} faculty already completed")
+        else:
+            completed = {}
+            self.journal.reset()
+        
+        if period['start_date'] > period['end_date']:
+            print("✅ Previous report already covers the whole period, nothing new to search")
+            completed = {name: [] for name in faculty_list}
+        
+        # Results stream through search -> (previous report) -> dedup -> sinks one faculty
+        # member at a time; the final reports are then queried from the result store
+        run_id = self.store.start_run(
+            min(p['start_date'] for p in periods) if periods else report_start,
+            max(p['end_date'] for p in periods) if periods else report_end
+        )
+        sinks = self.create_sinks(run_id)
+        total_articles = 0
+        faculty_found = set()
+        search_methods = {}
+        pending = [name for name in faculty_list if name not in completed]
+        searches = self.iter_faculty_searches(pending)
+        
+        try:
+            stream = self.iter_faculty_results(faculty_list, completed, searches)
+            if previous_results:
+                stream = self.with_previous(stream, previous_results)
             
-            # Progress update
-            if i % 20 == 0:
-                print(f"\n📊 Progress: {i}/{len(faculty_list)} faculty processed")
-                print(f"   Found articles for: {faculty_with_results} faculty")
-                print(f"   Total articles: {len(all_results)}")
-                print()
+            # Results arrive in roster order in all modes
+            for i, (faculty_name, new, updated) in enumerate(self.dedup_stage(stream), 1):
+                for sink in sinks:
+                    sink.write(new, updated)
+                total_articles += len(new)
+                for result in new + updated:
+                    faculty_found.update(result.faculty_names)
+                for result in new:
+                    search_methods[result.search_method] = search_methods.get(result.search_method, 0) + 1
+                
+                # Progress update
+                if i % 20 == 0:
+                    print(f"\n📊 Progress: {i}/{len(faculty_list)} faculty processed")
+                    print(f"   Found articles for: {len(faculty_found)} faculty")
+                    print(f"   Total articles: {total_articles}")
+                    print()
+        finally:
+            searches.close()
+            self.close_parse_pool()
+            for sink in sinks:
+                sink.close()
+            self.journal = None
+            period['start_date'], period['end_date'] = report_start, report_end
+            self.config['output']['max_results_per_faculty'] = max_results
+            self.date_extractor = DateExtractor.from_config(self.config)
+        faculty_with_results = len(faculty_found)
         
         # Final statistics
         print("\n" + "=" * 60)
@@ -705,34 +3038,140 @@ class EnhancedFacultyMediaTracker:
         print("=" * 60)
         print(f"Total faculty processed: {len(faculty_list)}")
         print(f"Faculty with articles: {faculty_with_results}")
-        print(f"Total articles found: {len(all_results)}")
+        print(f"Total articles found: {total_articles}")
         print(f"Success rate: {faculty_with_results/len(faculty_list)*100:.1f}%")
+        if self.cache is not None:
+            print(f"Query cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        previously_found = self.store.previously_found(run_id)
+        if previously_found:
+            print(f"Already found by earlier runs: {previously_found} articles")
         
         # Search method breakdown
-        if all_results:
-            search_methods = {}
-            for result in all_results:
-                method = result.get('search_method', 'Unknown')
-                search_methods[method] = search_methods.get(method, 0) + 1
-            
+        if search_methods:
             print(f"\n🔍 Search Method Breakdown:")
             for method, count in search_methods.items():
                 print(f"   {method}: {count} articles")
         
+        self.metrics.observe('stage', time.perf_counter() - run_start, stage='search')
+        for method, count in search_methods.items():
+            self.metrics.increment('results', count, search_method=method)
+        
         # Generate reports
-        excel_file = self.create_excel_report(all_results)
-        word_file = self.create_word_report(all_results)
+        if periods:
+            reports = [self.write_reports(run_id, p, max_results) for p in periods]
+        else:
+            reports = [self.write_reports(run_id)]
+        
+        self.print_metrics_summary()
+        self.export_metrics()
         
         print(f"\n✅ REPORTS GENERATED:")
-        print(f"📊 Excel: {excel_file}")
-        print(f"📄 Word: {word_file}")
+        for report in reports:
+            if report['period'] is not None:
+                print(f"🗓️  {report['period']['name']}: {report['total_articles']} articles")
+            print(f"📊 Excel: {report['excel']}")
+            print(f"📄 Word: {report['word']}")
+        
+        summary = {
+            'excel': reports[0]['excel'],
+            'word': reports[0]['word'],
+            'total_articles': total_articles,
+            'faculty_with_results': faculty_with_results
+        }
+        if periods:
+            summary['periods'] = reports
+        return summary
+    
+    def report_periods(self) -> List[Dict[str, str]]:
+        """Reporting windows for multi-period mode; empty for a normal single-period run"""
+        periods = []
+        for entry in self.config['search_period'].get('periods') or []:
+            # Unquoted YAML dates load as date objects
+            start, end = str(entry['start_date']), str(entry['end_date'])
+            if start > end:
+                print(f"⚠️  Skipping period {start} to {end}: start is after end")
+                continue
+            periods.append({'name': str(entry.get('name') or f"{start}_to_{end}"), 'start_date': start, 'end_date': end})
+        return periods
+    
+    def write_reports(self, run_id: int, report_period: Optional[Dict] = None, max_results: int = 0) -> Dict:
+        """Excel (plus any extra formats) and Word reports for one period, queried from the store"""
+        def results():
+            return self.store.run_results(run_id, report_period, max_results)
         
+        with self.metrics.timer('stage', stage='excel_report'):
+            excel_file = self.create_excel_report(results(), report_period)
+            for extra_format in self.config['output'].get('extra_formats') or []:
+                if extra_format == 'csv':
+                    self.create_csv_report(results(), report_period)
+                elif extra_format == 'parquet':
+                    self.create_parquet_report(results(), report_period)
+                else:
+                    print(f"⚠️  Unknown report format: {extra_format}")
+        with self.metrics.timer('stage', stage='word_report'):
+            word_file = self.create_word_report(self.store.faculty_results(run_id, report_period, max_results), report_period)
         return {
+            'period': report_period,
             'excel': excel_file,
             'word': word_file,
-            'total_articles': len(all_results),
-            'faculty_with_results': faculty_with_results
+            'total_articles': self.store.count(run_id, report_period, max_results)
         }
+    
+    def merge_shard_reports(self, excel_files: List[str]) -> Dict:
+        """Combine shard Excel reports into one deduplicated Excel/Word report for the whole roster"""
+        if self.shard() is not None:
+            raise ValueError("Merge shard reports without --shard")
+        
+        merged, periods, shards = [], [], set()
+        for excel_file in excel_files:
+            results, period = self.load_previous_report(excel_file)
+            print(f"📎 {excel_file}: {len(results)} articles")
+            merged.extend(results)
+            if period is not None:
+                periods.append(period)
+                if period.get('shard'):
+                    shards.add(period['shard'])
+        
+        counts = {int(shard.split('/')[1]) for shard in shards}
+        if len(counts) == 1:
+            missing = sorted(set(range(1, counts.pop() + 1)) - {int(shard.split('/')[0]) for shard in shards})
+            if missing:
+                print(f"⚠️  No report for shard(s) {', '.join(map(str, missing))}; their faculty will be missing")
+        period = self.config['search_period']
+        if periods:
+            if len({(p['start_date'], p['end_date']) for p in periods}) > 1:
+                print("⚠️  Shard reports cover different periods; the merged report spans all of them")
+            period['start_date'] = min(p['start_date'] for p in periods)
+            period['end_date'] = max(p['end_date'] for p in periods)
+        
+        # Same stages as a search run, with the shard reports standing in for the search
+        faculty_list = self.fetch_faculty_list()
+        self.name_matcher = FacultyNameMatcher(faculty_list)
+        run_id = self.store.start_run(period['start_date'], period['end_date'])
+        sinks = self.create_sinks(run_id)
+        try:
+            for _, new, updated in self.dedup_stage(self.with_previous(((name, []) for name in faculty_list), merged)):
+                for sink in sinks:
+                    sink.write(new, updated)
+        finally:
+            for sink in sinks:
+                sink.close()
+        
+        report = self.write_reports(run_id)
+        print(f"\n✅ MERGED {len(excel_files)} SHARD REPORTS: {report['total_articles']} articles")
+        print(f"📊 Excel: {report['excel']}")
+        print(f"📄 Word: {report['word']}")
+        return report
+    
+    def print_trend(self, faculty_name: Optional[str] = None):
+        """Articles per publication month across every run in the result store"""
+        rows = self.store.trend(faculty_name)
+        if not rows:
+            print("📭 No dated articles in the result store yet")
+            return
+        print(f"📈 Articles per month{' for ' + faculty_name if faculty_name else ''}:")
+        for month, articles, faculty in rows:
+            print(f"   {month}: {articles} articles, {faculty} faculty")
 
 def main():
     """Main function with command line interface"""
@@ -741,6 +3180,19 @@ def main():
     parser.add_argument('--create-config', action='store_true', help='Create a default configuration file')
     parser.add_argument('--quick-test', action='store_true', help='Run a quick test with first 5 faculty')
     parser.add_argument('--setup-api', action='store_true', help='Show API setup instructions')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the query cache')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached responses and re-fetch (cache is updated)')
+    parser.add_argument('--resume', action='store_true', help='Resume an interrupted run from the checkpoint journal')
+    parser.add_argument('--period', action='append', metavar='START:END[:NAME]',
+                        help='Report window (repeatable); all windows share one search over their union')
+    parser.add_argument('--shard', metavar='I/N',
+                        help='Search only shard I of N of the faculty roster (stable name hash), e.g. 2/4')
+    parser.add_argument('--merge', nargs='+', metavar='SHARD_XLSX',
+                        help='Merge shard Excel reports into one deduplicated Excel/Word report and exit')
+    parser.add_argument('--trend', nargs='?', const='', metavar='FACULTY',
+                        help='Print articles per month from the result store (optionally for one faculty member) and exit')
+    parser.add_argument('--incremental', metavar='PREVIOUS_XLSX',
+                        help='Only search dates after those covered by a previous Excel report and merge the results')
     
     args = parser.parse_args()
     
@@ -763,24 +3215,65 @@ def main():
         return
     
     if args.create_config:
-        tracker = EnhancedFacultyMediaTracker()
-        tracker.create_default_config(args.config)
+        EnhancedFacultyMediaTracker.create_default_config(args.config)
         return
     
+    if args.merge and args.shard:
+        parser.error("--merge combines every shard's reports; run it without --shard")
+    
     # Initialize tracker
     tracker = EnhancedFacultyMediaTracker(args.config)
     
+    if args.merge and tracker.shard() is not None:
+        tracker.close()
+        parser.error(f"--merge combines every shard's reports; clear shard.index in {args.config}")
+    
+    if args.shard:
+        match = re.fullmatch(r'(\d+)/(\d+)', args.shard.strip())
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            parser.error(f"--shard expects I/N with 1 <= I <= N, got {args.shard!r}")
+        tracker.set_shard(int(match.group(1)), int(match.group(2)))
+    
+    if args.merge:
+        try:
+            tracker.merge_shard_reports(args.merge)
+        finally:
+            tracker.close()
+        return
+    
+    if args.trend is not None:
+        try:
+            tracker.print_trend(args.trend or None)
+        finally:
+            tracker.close()
+        return
+    
+    if args.period:
+        periods = []
+        for value in args.period:
+            parts = value.split(':', 2)
+            if len(parts) < 2:
+                parser.error(f"--period expects START:END[:NAME], got {value!r}")
+            periods.append({'start_date': parts[0], 'end_date': parts[1], 'name': parts[2] if len(parts) > 2 else None})
+        tracker.config['search_period']['periods'] = periods
+    
+    if args.no_cache:
+        tracker.cache = None
+    elif args.refresh and tracker.cache is not None:
+        tracker.cache.refresh = True
+    
     if args.quick_test:
         print("🧪 Running quick test with first 5 faculty members...")
-        # Get the actual faculty list from website
+        # Get the actual faculty list (manual_list if configured, else website)
         faculty_list = tracker.fetch_faculty_list()
-        # Use first 5 for quick test
-        test_faculty = faculty_list[:5]
-        tracker.config['faculty']['manual_list'] = test_faculty
-        tracker.config['faculty']['auto_fetch_from_website'] = False
+        # Use first 5 for quick test; fetch_faculty_list prefers manual_list
+        tracker.config['faculty']['manual_list'] = faculty_list[:5]
     
     # Run the search
-    results = tracker.run_search()
+    try:
+        results = tracker.run_search(resume=args.resume, incremental_from=args.incremental)
+    finally:
+        tracker.close()
     
     print(f"\n🎉 Enhanced search completed successfully!")
     print(f"📁 Check the generated files for your results.")
@@ -16,7 +16,7 @@ if errorlevel 1 (
 REM Check if config file exists
 if not exist "config.yaml" (
     echo Creating configuration file...
-    python automated_faculty_media_tracker.py --create-config
+    python -m enhanced_faculty_media_tracker --create-config
     echo.
     echo Please edit config.yaml to set your desired date range
     echo Then run this script again.
@@ -26,7 +26,7 @@ if not exist "config.yaml" (
 
 REM Run the tracker
 echo Starting faculty media search...
-python automated_faculty_media_tracker.py
+python -m enhanced_faculty_media_tracker
 
 echo.
 echo Search completed! Check the generated files.
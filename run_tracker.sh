@@ -15,7 +15,7 @@ fi
 # Check if config file exists
 if [ ! -f "config.yaml" ]; then
     echo "Creating configuration file..."
-    python3 automated_faculty_media_tracker.py --create-config
+    python3 -m enhanced_faculty_media_tracker --create-config
     echo
     echo "Please edit config.yaml to set your desired date range"
     echo "Then run this script again."
@@ -24,7 +24,7 @@ fi
 
 # Run the tracker
 echo "Starting faculty media search..."
-python3 automated_faculty_media_tracker.py
+python3 -m enhanced_faculty_media_tracker
 
 echo
 echo "Search completed! Check the generated files."